@@ -4,8 +4,8 @@ import argparse
 import traceback
 from pathlib import Path
 
-SHOULD_SHOW_SPLASH = not (getattr(sys, 'frozen', False) and sys.platform == 'darwin')
 is_pyinstaller_bundle = getattr(sys, 'frozen', False)
+SHOULD_SHOW_SPLASH = not (is_pyinstaller_bundle and sys.platform == 'darwin')
 if is_pyinstaller_bundle:
     try:
         import pyi_splash
@@ -17,14 +17,6 @@ if is_pyinstaller_bundle:
     except (ImportError, KeyError):
         pass
 
-from PySide6.QtWidgets import QApplication, QSplashScreen
-from PySide6.QtGui import QIcon, QPixmap
-from PySide6.QtCore import Qt, QTimer
-import qdarktheme
-from ssmm.main_window import MainWindow, EmittingStream
-from ssmm.utils import resolve_resource_path, install_translators
-from ssmm import app_settings
-
 MIN_PYTHON_VERSION = (3, 10)
 
 def check_python_version():
@@ -40,45 +32,57 @@ def check_python_version():
         )
         sys.exit(1)
 
-class SplashScreenManager:
-    def __init__(self, splash_screen, main_window):
-        self.splash = splash_screen
-        self.window = main_window
-        self.app_is_ready = False
-        self.timer_is_done = False
-
-    def set_app_ready(self):
-        self.app_is_ready = True
-        self.close_if_ready()
-
-    def set_timer_done(self):
-        self.timer_is_done = True
-        self.close_if_ready()
+# Splash backends close as soon as the main window is first shown,
+# instead of holding the splash for a fixed minimum time.
+class NoopSplashBackend:
+    def show(self, app):
+        pass
 
-    def close_if_ready(self):
-        if self.app_is_ready and self.timer_is_done:
-            self.splash.finish(self.window)
+    def close(self, window=None):
+        pass
 
-class PyiSplashScreenManager:
+class QtSplashBackend(NoopSplashBackend):
     def __init__(self):
-        self.window_is_ready = False
-        self.timer_is_done = False
+        self.splash = None
 
-    def set_window_ready(self):
-        self.window_is_ready = True
-        self.close_if_ready()
+    def show(self, app):
+        from PySide6.QtWidgets import QSplashScreen
+        from PySide6.QtCore import Qt
+        from ssmm.utils import load_cached_pixmap, resolve_resource_path
+        try:
+            splash_pix = load_cached_pixmap(resolve_resource_path("resources/assets/splash_screen.png"))
+            if not splash_pix.isNull():
+                self.splash = QSplashScreen(splash_pix, Qt.WindowStaysOnTopHint)
+                self.splash.show()
+                self.splash.showMessage("Loading application, please wait...", Qt.AlignBottom | Qt.AlignCenter, Qt.white)
+                app.processEvents()
+        except Exception as e:
+            print(f"Could not create QSplashScreen: {e}")
 
-    def set_timer_done(self):
-        self.timer_is_done = True
-        self.close_if_ready()
+    def close(self, window=None):
+        if self.splash:
+            if window is not None:
+                self.splash.finish(window)
+            else:
+                self.splash.close()
+            self.splash = None
 
-    def close_if_ready(self):
-        if self.window_is_ready and self.timer_is_done:
-            try:
-                import pyi_splash
-                pyi_splash.close()
-            except (ImportError, KeyError, RuntimeError):
-                pass
+class PyiSplashBackend(NoopSplashBackend):
+    # The PyInstaller bootloader has already put this splash on screen.
+    def close(self, window=None):
+        try:
+            import pyi_splash
+            pyi_splash.close()
+        except (ImportError, KeyError, RuntimeError):
+            pass
+
+# Keyed by (is_pyinstaller_bundle, SHOULD_SHOW_SPLASH); a frozen macOS build has
+# already closed its splash above and needs nothing further.
+_SPLASH_BACKENDS = {
+    (True, True): PyiSplashBackend,
+    (False, True): QtSplashBackend,
+}
+splash_backend = _SPLASH_BACKENDS.get((is_pyinstaller_bundle, SHOULD_SHOW_SPLASH), NoopSplashBackend)()
 
 if __name__ == "__main__":
     check_python_version()
@@ -98,12 +102,19 @@ if __name__ == "__main__":
     )
     args = parser.parse_args()
 
+    # Qt and the application modules are imported only after the version check and
+    # argument parsing, so the PyInstaller splash is already up while they load.
+    from PySide6.QtWidgets import QApplication
+    from PySide6.QtGui import QIcon, QPixmapCache
+    from ssmm import config
+    from ssmm.utils import resolve_resource_path, install_translators, load_app_stylesheet, load_cached_pixmap
+    from ssmm import app_settings
+
     app = QApplication(sys.argv)
     # Identify the app so QStandardPaths/QSettings resolve to a stable per-app location.
     app.setOrganizationName("SSMM")
     app.setApplicationName("SSMM")
-    theme_arg = app_settings.theme_to_stylesheet_arg(app_settings.get_theme())
-    QApplication.instance().setStyleSheet(qdarktheme.load_stylesheet(theme_arg))
+    QPixmapCache.setCacheLimit(config.PIXMAP_CACHE_LIMIT_KB)
     # Install before MainWindow is built so its tr() strings resolve at construction.
     translators = install_translators(app)
 
@@ -112,36 +123,24 @@ if __name__ == "__main__":
     exit_code = 0
 
     try:
-        splash = None
-        manager = None
-        pyi_manager = None
-
-        if SHOULD_SHOW_SPLASH:
-            if not is_pyinstaller_bundle:
-                try:
-                    splash_pix = QPixmap(str(resolve_resource_path("resources/assets/splash_screen.png")))
-                    if not splash_pix.isNull():
-                        splash = QSplashScreen(splash_pix, Qt.WindowStaysOnTopHint)
-                        splash.show()
-                        splash.showMessage("Loading application, please wait...", Qt.AlignBottom | Qt.AlignCenter, Qt.white)
-                except Exception as e:
-                    print(f"Could not create QSplashScreen: {e}")
-            else:
-                pyi_manager = PyiSplashScreenManager()
+        splash_backend.show(app)
+
+        # The splash is painted by now; pay for the theme and the main window imports.
+        theme_arg = app_settings.theme_to_stylesheet_arg(app_settings.get_theme())
+        app.setStyleSheet(load_app_stylesheet(theme_arg))
+        from ssmm.main_window import MainWindow, EmittingStream
 
         window = MainWindow(
             verbose_startup=args.verbose,
             project_path_on_startup=args.project_path
         )
 
-        if splash:
-            manager = SplashScreenManager(splash, window)
-            QTimer.singleShot(4000, manager.set_timer_done)
+        window.first_shown.connect(lambda: splash_backend.close(window))
 
         try:
             icon_path = resolve_resource_path("resources/assets/app_icon.png")
             if icon_path.exists():
-                app_icon = QIcon(str(icon_path))
+                app_icon = QIcon(load_cached_pixmap(icon_path))
                 window.setWindowIcon(app_icon)
         except Exception as e:
             print(f"Could not load application icon: {e}")
@@ -155,25 +154,13 @@ if __name__ == "__main__":
 
         window.show()
 
-        if SHOULD_SHOW_SPLASH:
-            if is_pyinstaller_bundle and pyi_manager:
-                QTimer.singleShot(4000, pyi_manager.set_timer_done)
-                pyi_manager.set_window_ready()
-            elif manager:
-                manager.set_app_ready()
-
         exit_code = app.exec()
 
     except Exception as e:
         original_stderr.write(f"\n[FATAL] An unhandled exception occurred during application lifecycle: {e}\n")
         traceback.print_exc(file=original_stderr)
         exit_code = 1
-        if is_pyinstaller_bundle:
-            try:
-                import pyi_splash
-                pyi_splash.close()
-            except (ImportError, KeyError, RuntimeError) as splash_e:
-                original_stderr.write(f"Additionally, failed to close PyInstaller splash screen: {splash_e}\n")
+        splash_backend.close()
 
     finally:
         sys.stdout = original_stdout
@@ -1,10 +1,17 @@
 # config.py
+import functools
+import re
 import sys
 import subprocess
+from types import MappingProxyType
 
 SUBPROCESS_CREATION_FLAGS = subprocess.CREATE_NO_WINDOW if sys.platform.startswith('win') else 0
 
+@functools.lru_cache(maxsize=1)
 def get_version():
+    # Frozen bundles carry ssmm/_version.py; never spawn git from an installed build.
+    if getattr(sys, 'frozen', False):
+        return 'local-dev'
     try:
         git_process = subprocess.run(
             ["git", "describe", "--tags", "--always"],
@@ -18,7 +25,10 @@ def get_version():
     except (subprocess.CalledProcessError, FileNotFoundError):
         return 'local-dev'
 
-APP_VERSION = get_version()
+try:
+    from ssmm._version import APP_VERSION
+except ImportError:
+    APP_VERSION = get_version()
 REPO_URL = "https://github.com/yosukey/SSMM"
 
 ENCODER_TEST_TIMEOUT_S = 15
@@ -68,6 +78,12 @@ LOUDNORM_MODES = {
 SUPPORTED_AUDIO_FORMATS = ('.mp3', '.flac', '.aac', '.wav')
 SUPPORTED_VIDEO_FORMATS = ('.mp4', '.avi', '.mov')
 SUPPORTED_FORMATS = SUPPORTED_AUDIO_FORMATS + SUPPORTED_VIDEO_FORMATS
+# Tuples above feed str.endswith(); use these for suffix membership tests.
+SUPPORTED_AUDIO_FORMATS_SET = frozenset(f.lower() for f in SUPPORTED_AUDIO_FORMATS)
+SUPPORTED_VIDEO_FORMATS_SET = frozenset(f.lower() for f in SUPPORTED_VIDEO_FORMATS)
+SUPPORTED_FORMATS_SET = SUPPORTED_AUDIO_FORMATS_SET | SUPPORTED_VIDEO_FORMATS_SET
+# Everything that makes up a project folder's contents (materials plus the PDF).
+PROJECT_FILE_FORMATS_SET = SUPPORTED_FORMATS_SET | {'.pdf'}
 
 SILENT_MATERIAL_NAME = "SILENT"
 UNASSIGNED_MATERIAL_NAME = "(Select Material)"
@@ -82,10 +98,21 @@ CHROMA_KEY_BLEND = 0.02
 ENCODER_TEST_RESOLUTION = "320x240"
 ENCODER_TEST_FRAMERATE = "30"
 ENCODER_TEST_DURATION_S = 1
+# Cached encoder probe results are re-tested after this long to pick up driver changes.
+ENCODER_CACHE_MAX_AGE_S = 7 * 24 * 3600
+
+# Project files are hashed concurrently; more readers than this just thrash spinning disks.
+FILE_HASH_MAX_WORKERS = 4
 
 PDF_THUMBNAIL_ZOOM_FACTOR = 0.25
+# Room for decoded slide thumbnails and bundled image assets in QPixmapCache.
+PIXMAP_CACHE_LIMIT_KB = 64 * 1024
 PINP_PREVIEW_UPDATE_DELAY_MS = 300
 DURATION_RECALC_DELAY_MS = 500
+# Bursts of parameter widget signals are collapsed into one model sync within this window.
+PARAMETER_CHANGE_COALESCE_MS = 50
+# Debug log lines are buffered and inserted into the log view at most this often.
+LOG_FLUSH_INTERVAL_MS = 50
 SILENT_DURATION_RANGE = (1, 100)
 PINP_SCALE_RANGE = (5, 100)
 ENCODING_CRF_RANGE = (0, 51)
@@ -110,28 +137,34 @@ SUPPORTED_CODEC_CHECKS = {
     "AV1": ["libaom-av1", "av1_nvenc", "av1_qsv", "av1_amf", "av1_videotoolbox"],
 }
 
-CODEC_MAP = {
-    'H.264/MPEG-4 AVC': {
+# Read-only lookup tables are exposed as MappingProxyType so callers cannot mutate them.
+CODEC_MAP = MappingProxyType({
+    'H.264/MPEG-4 AVC': MappingProxyType({
         'NVIDIA': 'h264_nvenc',
         'Intel': 'h264_qsv',
         'videotoolbox': 'h264_videotoolbox',
         'AMD': 'h264_amf'
-    },
-    'H.265/HEVC': {
+    }),
+    'H.265/HEVC': MappingProxyType({
         'NVIDIA': 'hevc_nvenc',
         'Intel': 'hevc_qsv',
         'videotoolbox': 'hevc_videotoolbox',
         'AMD': 'hevc_amf'
-    },
-    'AV1': {
+    }),
+    'AV1': MappingProxyType({
         'NVIDIA': 'av1_nvenc',
         'Intel': 'av1_qsv',
         # No 'videotoolbox' entry: FFmpeg has no av1_videotoolbox encoder.
         'AMD': 'av1_amf'
-    }
-}
+    })
+})
+
+@functools.lru_cache(maxsize=64)
+def get_hw_encoder_name(codec: str, hardware: str | None) -> str | None:
+    # FFmpeg encoder name for a codec/hardware pair, or None when there is no mapping.
+    return CODEC_MAP.get(codec, {}).get(hardware)
 
-SOFTWARE_CODEC_MAP = {'MPEG-4 Part 2': 'mpeg4', 'H.264/MPEG-4 AVC': 'libx264', 'H.265/HEVC': 'libx265', 'AV1': 'libaom-av1'}
+SOFTWARE_CODEC_MAP = MappingProxyType({'MPEG-4 Part 2': 'mpeg4', 'H.264/MPEG-4 AVC': 'libx264', 'H.265/HEVC': 'libx265', 'AV1': 'libaom-av1'})
 
 SILENT_AUDIO_SOURCE = 'anullsrc=channel_layout=stereo:sample_rate=44100'
 
@@ -143,7 +176,7 @@ BUNDLED_FONTS = {
     "Noto Sans Thai": "NotoSansThai-Regular.ttf",
 }
 
-TRANSITION_MAPPINGS = {
+TRANSITION_MAPPINGS = MappingProxyType({
     "None": None,
     "Fade": "fade",
     "Fade Black": "fadeblack",
@@ -175,17 +208,17 @@ TRANSITION_MAPPINGS = {
     "Diagonal TR": "diagtr",
     "Dissolve": "dissolve",
     "Pixelize": "pixelize"
-}
+})
 
-VIDEO_POSITION_MAP = {
+VIDEO_POSITION_MAP = MappingProxyType({
     'Center': {'x': '(main_w-overlay_w)/2', 'y': '(main_h-overlay_h)/2'},
     'Upper Left': {'x': '0', 'y': '0'},
     'Upper Right': {'x': 'main_w-overlay_w', 'y': '0'},
     'Bottom Left': {'x': '0', 'y': 'main_h-overlay_h'},
     'Bottom Right': {'x': 'main_w-overlay_w', 'y': 'main_h-overlay_h'},
-}
+})
 
-VIDEO_EFFECT_MAP = {
+VIDEO_EFFECT_MAP = MappingProxyType({
     "None": "None",
 
     "Circle": "Circle",
@@ -200,7 +233,7 @@ VIDEO_EFFECT_MAP = {
     "VFlip": "Vertical Flip",
     "Blur": "Blur",
     "Pixelate": "Pixelate",
-}
+})
 
 EFFECT_GROUPS = {
     "Shape": ["Circle", "Chroma", "Vignette"],
@@ -208,17 +241,18 @@ EFFECT_GROUPS = {
     "Processing": ["HFlip", "VFlip", "Blur", "Pixelate"]
 }
 
-ENCODER_TO_HARDWARE_MAP = {
+ENCODER_TO_HARDWARE_MAP = MappingProxyType({
     encoder_name: hw_name
     for codec, hw_map in CODEC_MAP.items()
     for hw_name, encoder_name in hw_map.items()
-}
+})
 
 FILENAME_ILLEGAL_CHARS = r'<>:"/\|?*'
+FILENAME_ILLEGAL_RE = re.compile('[' + re.escape(FILENAME_ILLEGAL_CHARS) + ']')
 FILENAME_MAX_LENGTH = 240
-FILENAME_RESERVED_NAMES = (
+FILENAME_RESERVED_NAMES = frozenset((
     'CON', 'PRN', 'AUX', 'NUL', 'COM1', 'COM2', 'COM3', 'COM4', 'COM5', 'COM6', 'COM7', 'COM8', 'COM9',
     'LPT1', 'LPT2', 'LPT3', 'LPT4', 'LPT5', 'LPT6', 'LPT7', 'LPT8', 'LPT9'
-)
+))
 
 LOG_STATE_TRANSITIONS = True
\ No newline at end of file
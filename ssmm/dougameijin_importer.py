@@ -9,6 +9,7 @@ from PIL import Image
 
 from ssmm import config
 from ssmm.models import ProjectModel, ProjectParameters, Slide
+from ssmm.utils import material_suffix, scan_material_names
 
 
 # --- DougaMeijin format constants (mirror DougaMeijin/config.py) ---
@@ -159,7 +160,7 @@ def import_project(dmj_path, extract_dir=None, log=None) -> ProjectModel:
 
                     if material_name:
                         slide.filename = material_name
-                        slide.is_video = material_name.lower().endswith(config.SUPPORTED_VIDEO_FORMATS)
+                        slide.is_video = material_suffix(material_name) in config.SUPPORTED_VIDEO_FORMATS_SET
                     else:
                         slide.filename = config.SILENT_MATERIAL_NAME
                         slide.duration = config.DEFAULT_SLIDE_INTERVAL
@@ -177,10 +178,7 @@ def import_project(dmj_path, extract_dir=None, log=None) -> ProjectModel:
         model = ProjectModel()
         model.project_folder = dest_folder
         model.slides = slides
-        model.available_materials = sorted([
-            p.name for p in dest_folder.iterdir()
-            if p.is_file() and p.suffix.lower() in config.SUPPORTED_FORMATS
-        ])
+        model.available_materials = scan_material_names(dest_folder)
 
         params = ProjectParameters()
         dmj_resolution = project_data.get("resolution")
@@ -8,6 +8,7 @@ class FFmpegCommandBuilder:
         self.filter_complex = None
         self.output_path = None
         self.output_options = []
+        self.extra_outputs = []
         self.global_options = ['-y', '-hide_banner']
 
     def add_global_options(self, *opts: str) -> 'FFmpegCommandBuilder':
@@ -15,7 +16,7 @@ class FFmpegCommandBuilder:
         return self
 
     def add_input(self, path: str | Path, options: list[str] | None = None) -> 'FFmpegCommandBuilder':
-        self.inputs.append({'path': path, 'options': options or []})
+        self.inputs.append({'path': str(path), 'options': options or []})
         return self
 
     def set_filter_complex(self, filter_string: str) -> 'FFmpegCommandBuilder':
@@ -23,25 +24,38 @@ class FFmpegCommandBuilder:
         return self
 
     def set_output(self, path: str | Path, options: list[str] | None = None) -> 'FFmpegCommandBuilder':
-        self.output_path = path
+        self.output_path = str(path)
         self.output_options = options or []
         return self
 
+    def add_output(self, path: str | Path, options: list[str] | None = None, maps: list[str] | None = None) -> 'FFmpegCommandBuilder':
+        # Lets one ffmpeg process write several files; each output gets its own -map selection.
+        output_options = [arg for label in (maps or []) for arg in ('-map', label)] + (options or [])
+        if self.output_path is None:
+            return self.set_output(path, output_options)
+        self.extra_outputs.append({'path': str(path), 'options': output_options})
+        return self
+
     def build(self) -> list[str]:
         if not self.output_path:
             raise ValueError("Output path must be set before building the command.")
 
+        # Paths are stringified once when added, so build() only concatenates.
         cmd = [str(get_ffmpeg_path())]
-        cmd.extend(self.global_options)
+        cmd += self.global_options
 
         for inp in self.inputs:
-            cmd.extend(inp['options'])
-            cmd.extend(['-i', str(inp['path'])])
+            cmd += inp['options']
+            cmd += ('-i', inp['path'])
 
         if self.filter_complex:
-            cmd.extend(['-filter_complex', self.filter_complex])
+            cmd += ('-filter_complex', self.filter_complex)
+
+        cmd += self.output_options
+        cmd.append(self.output_path)
 
-        cmd.extend(self.output_options)
-        cmd.append(str(self.output_path))
+        for out in self.extra_outputs:
+            cmd += out['options']
+            cmd.append(out['path'])
         
         return cmd
\ No newline at end of file
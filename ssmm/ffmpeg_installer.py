@@ -1,6 +1,8 @@
 # ffmpeg_installer.py
+import codecs
 import os
 import platform
+import shutil
 import subprocess
 from pathlib import Path
 from PySide6.QtCore import QThread, Signal
@@ -18,22 +20,17 @@ class FFmpegInstaller(QThread):
         return None
 
     def _get_tool_executable_path(self, name: str) -> str | None:
-        try:
-            subprocess.run([name, '--version'], check=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
-                           creationflags=config.SUBPROCESS_CREATION_FLAGS, timeout=10)
-            return name
-        except (OSError, subprocess.CalledProcessError, subprocess.TimeoutExpired):
-            if platform.system() == 'Windows' and name == 'winget':
-                winget_path = self._get_windows_winget_path()
-                if winget_path:
-                    try:
-                        subprocess.run([str(winget_path), '--version'], check=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
-                                       creationflags=config.SUBPROCESS_CREATION_FLAGS, timeout=10)
-                        return str(winget_path)
-                    except (OSError, subprocess.CalledProcessError, subprocess.TimeoutExpired):
-                        pass
+        # Resolve via PATH in-process; no need to spawn '<tool> --version' just to see if it exists.
+        executable = shutil.which(name)
+        if executable:
+            return executable
+
+        if platform.system() == 'Windows' and name == 'winget':
+            winget_path = self._get_windows_winget_path()
+            if winget_path:
+                return str(winget_path)
 
-            return None
+        return None
 
     def run(self):
         system = platform.system()
@@ -85,17 +82,37 @@ class FFmpegInstaller(QThread):
             command,
             stdout=subprocess.PIPE,
             stderr=subprocess.STDOUT,
-            text=True,
-            encoding='utf-8',
-            errors='replace',
             creationflags=config.SUBPROCESS_CREATION_FLAGS
         )
 
         if process.stdout:
-            for line in iter(process.stdout.readline, ''):
-                if line:
-                    self.log_message.emit(line.strip())
+            # Read whatever is available in one go and emit all complete lines together,
+            # rather than one signal per line. select() does not work on Windows pipes,
+            # so rely on read1() returning as soon as any data is ready.
+            decoder = codecs.getincrementaldecoder('utf-8')(errors='replace')
+            pending = ''
+            while True:
+                chunk = process.stdout.read1(65536)
+                if not chunk:
+                    break
+                pending += decoder.decode(chunk)
+                # winget redraws its progress bar with bare '\r', so treat '\r\n' and '\r'
+                # as line breaks too. A trailing '\r' may be half of a '\r\n' split across
+                # reads; keep it buffered with the incomplete last piece.
+                held_cr = pending.endswith('\r')
+                if held_cr:
+                    pending = pending[:-1]
+                lines = pending.replace('\r\n', '\n').replace('\r', '\n').split('\n')
+                pending = lines.pop() + ('\r' if held_cr else '')
+                self._emit_lines(lines)
+            pending += decoder.decode(b'', final=True)
+            self._emit_lines(pending.splitlines())
 
         process.wait()
         if process.returncode != 0:
-            raise subprocess.CalledProcessError(process.returncode, command, self.tr("Process exited with a non-zero status."))
\ No newline at end of file
+            raise subprocess.CalledProcessError(process.returncode, command, self.tr("Process exited with a non-zero status."))
+
+    def _emit_lines(self, lines: list[str]):
+        text = "\n".join(line.strip() for line in lines if line.strip())
+        if text:
+            self.log_message.emit(text)
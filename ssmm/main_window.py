@@ -1,30 +1,29 @@
 # main_window.py
-import copy
+import bisect
+import dataclasses
 import datetime
-import json
+import functools
+import hashlib
+import importlib
+import importlib.metadata
+import io
 import platform
 import re
-import subprocess
 import sys
+import threading
 import time
 from pathlib import Path
-from urllib import request
-from packaging.version import parse as parse_version
 from typing import Optional, Callable
 import os
 import shutil
 
-import psutil
-import PIL
 import PySide6
-import toml
-import imagehash
 
-import qdarktheme
-from PySide6.QtCore import (QItemSelection, QItemSelectionModel, QObject, Qt,
-                            QTimer, QUrl, Signal, QStandardPaths)
+from PySide6.QtCore import (QEvent, QItemSelection, QItemSelectionModel, QObject, Qt,
+                            QSize, QThreadPool, QTimer, QUrl, Signal, Slot, QStandardPaths)
 from PySide6.QtGui import (QAction, QActionGroup, QColor, QDesktopServices, QMovie,
-                           QPalette, QTextCharFormat, QTextCursor, QShowEvent)
+                           QPalette, QPixmap, QTextCharFormat, QTextCursor, QShowEvent,
+                           QWindow)
 from PySide6.QtWidgets import (QAbstractItemView, QApplication, QComboBox,
                                QDialog, QFileDialog, QGridLayout, QLabel,
                                QMenuBar, QMessageBox, QScrollArea, QStyle,
@@ -42,10 +41,12 @@ from ssmm.ui_dialogs import (EditSlidesDialog, InstallProgressDialog,
                         SelectSlideDialog, PageMappingDialog)
 from ssmm.ui_main import Ui_MainWindow
 from ssmm.ui_state_manager import UIStateManager
-from ssmm.utils import (bundled_ffmpeg_exists, get_ffmpeg_path, get_ffmpeg_source,
-                   resolve_resource_path)
+from ssmm.utils import (bundled_ffmpeg_exists, ffmpeg_pair_available, get_cache_dir, get_ffmpeg_path, get_ffmpeg_source,
+                   get_tool_version_line, load_app_stylesheet, material_suffix, resolve_resource_path,
+                   scan_material_names)
 from ssmm.validator import ProjectValidator
 from ssmm.worker_manager import WorkerManager
+from ssmm.workers import DebugLogExportTask, FFmpegProbeTask, UpdateCheckTask
 
 try:
     from capabilities import load_capabilities
@@ -53,6 +54,20 @@ except Exception:
     def load_capabilities():
         return {"EDITION": "B", "FFMPEG_INSTALL_MENU": True}
 
+_LOG_PREFIX_COLORS = (
+    ('[FATAL]', QColor("red")),
+    ('[ERROR]', QColor("red")),
+    ('[WARNING]', QColor("orange")),
+    ('[SUCCESS]', QColor("green")),
+    ('[DEBUG]', QColor("blue")),
+    ('[STATE_TRANSITION]', QColor("magenta")),
+)
+_FFMPEG_LOG_COLOR = QColor("grey")
+_VERBOSE_LOG_PREFIXES = ('[DEBUG]', '[STATE_TRANSITION]')
+
+# Materials named "[NNN]..." are assigned to slide NNN automatically.
+_AUTOMAP_RE = re.compile(r'\[(\d{3})\]')
+
 class AppStateMachine(QObject):
     state_changed = Signal(AppState, AppState)
 
@@ -76,11 +91,98 @@ class AppStateMachine(QObject):
         self._state = new_state
         self.state_changed.emit(old_state, new_state)
 
+# First-frame previews for the transition gallery, keyed by (gif path, label size).
+_STATIC_GIF_CACHE: dict[tuple[str, tuple[int, int]], QPixmap] = {}
+
+def _load_gif_first_frame(gif_path: Path, size: QSize) -> Optional[QPixmap]:
+    # Scaled first frames are also kept on disk, so later launches skip the GIF decode.
+    # Keyed on the GIF's content: the onefile build re-extracts resources with fresh
+    # mtimes on every launch, so stat data would never match.
+    try:
+        digest = hashlib.blake2s(gif_path.read_bytes(), digest_size=8).hexdigest()
+    except OSError:
+        return None
+    thumb_dir = get_cache_dir() / "transition_thumbs"
+    thumb_prefix = f"{gif_path.stem}_{size.width()}x{size.height()}_"
+    thumb_path = thumb_dir / f"{thumb_prefix}{digest}.png"
+
+    pixmap = QPixmap()
+    if thumb_path.is_file() and pixmap.load(str(thumb_path)):
+        return pixmap
+
+    movie = QMovie(str(gif_path))
+    if not movie.isValid():
+        return None
+    movie.jumpToFrame(0)
+    frame = movie.currentPixmap()
+    if frame.isNull():
+        return None
+    pixmap = frame.scaled(size, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+    try:
+        thumb_dir.mkdir(parents=True, exist_ok=True)
+        # Drop thumbnails of this GIF and size rendered from older content.
+        for stale in thumb_dir.glob(f"{thumb_prefix}*.png"):
+            if stale != thumb_path:
+                stale.unlink(missing_ok=True)
+        pixmap.save(str(thumb_path), "PNG")
+    except OSError:
+        pass
+    return pixmap
+
+@functools.lru_cache(maxsize=1)
+def _version_parser() -> Optional[Callable]:
+    # packaging is only needed by the manual update check; import it once on first use.
+    try:
+        from packaging.version import parse
+    except ImportError:
+        return None
+    return parse
+
+@functools.lru_cache(maxsize=1)
+def _cpu_topology() -> tuple[Optional[int], Optional[int], Optional[float]]:
+    # Core counts and the rated maximum frequency are fixed for the process lifetime;
+    # cpu_freq() reads one sysfs file per core on Linux, so query it only once.
+    import psutil
+    cpu_freq = psutil.cpu_freq()
+    return (psutil.cpu_count(logical=False), psutil.cpu_count(logical=True),
+            cpu_freq.max if cpu_freq else None)
+
+def _library_version(dist_name: str, module_name: str) -> str:
+    # Package metadata gives the version without importing the library itself.
+    try:
+        return importlib.metadata.version(dist_name)
+    except importlib.metadata.PackageNotFoundError:
+        pass
+    try:
+        module = importlib.import_module(module_name)
+    except ImportError:
+        return "Not installed"
+    return getattr(module, '__version__', 'N/A')
+
+def _fmt_gb(bytes_val: int) -> str:
+    return f"{bytes_val / 1073741824:.2f}"
+
+def _disk_usage(mountpoint: str) -> tuple[int, int, int, float]:
+    # One statvfs() call per mount where available, computed the way psutil.disk_usage does.
+    if hasattr(os, 'statvfs'):
+        st = os.statvfs(mountpoint)
+        total = st.f_blocks * st.f_frsize
+        used = total - st.f_bfree * st.f_frsize
+        free = st.f_bavail * st.f_frsize
+        total_user = used + free
+        percent = round(used / total_user * 100, 1) if total_user else 0.0
+        return total, used, free, percent
+    import psutil
+    usage = psutil.disk_usage(mountpoint)
+    return usage.total, usage.used, usage.free, usage.percent
+
 class HoverGifWidget(QWidget):
     def __init__(self, gif_path: Path, caption_text: str, parent=None):
         super().__init__(parent)
         self.gif_path = gif_path
         self.movie = None
+        self.static_pixmap: Optional[QPixmap] = None
+        self._static_frame_loaded = False
 
         layout = QVBoxLayout(self)
         layout.setContentsMargins(5, 5, 5, 5)
@@ -91,24 +193,41 @@ class HoverGifWidget(QWidget):
         self.gif_label.setFixedSize(200, 150)
         self.gif_label.setStyleSheet("border: 1px solid #555; border-radius: 4px; background-color: #3c3c3c;")
 
-        temp_movie = QMovie(str(self.gif_path))
-        if temp_movie.isValid():
-            temp_movie.jumpToFrame(0)
-            pixmap = temp_movie.currentPixmap()
-            if not pixmap.isNull():
-                self.static_pixmap = pixmap.scaled(self.gif_label.size(), Qt.KeepAspectRatio, Qt.SmoothTransformation)
-                self.gif_label.setPixmap(self.static_pixmap)
-        
         caption_label = QLabel(caption_text)
         caption_label.setAlignment(Qt.AlignCenter)
 
         layout.addWidget(self.gif_label)
         layout.addWidget(caption_label)
 
+    def _load_static_frame(self):
+        self._static_frame_loaded = True
+        label_size = self.gif_label.size()
+        cache_key = (str(self.gif_path), (label_size.width(), label_size.height()))
+        static_pixmap = _STATIC_GIF_CACHE.get(cache_key)
+        if static_pixmap is None:
+            static_pixmap = _load_gif_first_frame(self.gif_path, label_size)
+            if static_pixmap is not None:
+                _STATIC_GIF_CACHE[cache_key] = static_pixmap
+        if static_pixmap is not None:
+            self.static_pixmap = static_pixmap
+            if self.movie is None or self.movie.state() != QMovie.MovieState.Running:
+                self.gif_label.setPixmap(self.static_pixmap)
+
+    def paintEvent(self, event):
+        # Paint events only reach cells inside the scroll viewport, so off-screen
+        # transitions never decode their preview frame until scrolled into view.
+        if not self._static_frame_loaded:
+            self._load_static_frame()
+        super().paintEvent(event)
+
     def enterEvent(self, event):
-        if self.gif_path.exists() and self.movie is None:
-            self.movie = QMovie(str(self.gif_path))
+        if self.movie is None and self.gif_path.exists():
+            # Created on first hover and kept for the widget's lifetime; CacheAll lets
+            # later hovers replay decoded frames instead of re-reading the GIF.
+            self.movie = QMovie(str(self.gif_path), parent=self)
+            self.movie.setCacheMode(QMovie.CacheMode.CacheAll)
             self.movie.setScaledSize(self.gif_label.size())
+        if self.movie is not None:
             self.gif_label.setMovie(self.movie)
             self.movie.start()
         super().enterEvent(event)
@@ -116,28 +235,74 @@ class HoverGifWidget(QWidget):
     def leaveEvent(self, event):
         if self.movie is not None:
             self.movie.stop()
-            self.movie = None
-            self.gif_label.setMovie(None)
-            if hasattr(self, 'static_pixmap'):
+            self.movie.jumpToFrame(0)
+            if self.static_pixmap is not None:
                 self.gif_label.setPixmap(self.static_pixmap)
+            else:
+                self.gif_label.clear()
         super().leaveEvent(event)
 
 class EmittingStream(QObject):
     text_written = Signal(str, str)
+    _partial_pending = Signal()
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        # print() issues separate writes for the text and the newline; buffer them so
+        # each call reaches the log as one signal. Workers may print concurrently.
+        self._buffer = ''
+        self._lock = threading.Lock()
+        self._flush_scheduled = False
+        # Output without a trailing newline (progress dots, prompts) is flushed shortly
+        # after the last write. The timer lives in the GUI thread, so worker threads
+        # reach it through a queued signal.
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setInterval(16)
+        self._flush_timer.timeout.connect(self.flush)
+        self._partial_pending.connect(self._flush_timer.start)
+
     def write(self, text):
-        self.text_written.emit(str(text), 'app')
+        text = str(text)
+        with self._lock:
+            self._buffer += text
+            complete, newline, self._buffer = self._buffer.rpartition('\n')
+            schedule = bool(self._buffer) and not self._flush_scheduled
+            if schedule:
+                self._flush_scheduled = True
+        if newline and complete:
+            self.text_written.emit(complete, 'app')
+        if schedule:
+            self._partial_pending.emit()
+        return len(text)
+
     def flush(self):
-        pass
+        with self._lock:
+            pending, self._buffer = self._buffer, ''
+            self._flush_scheduled = False
+        if pending:
+            self.text_written.emit(pending, 'app')
 
 class MainWindow(QWidget):
     __version__ = config.APP_VERSION
+    first_shown = Signal()
+    # Style metric shared by every combo popup; looked up once per process.
+    _scrollbar_extent: Optional[int] = None
     
     def __init__(self, verbose_startup: bool = False, project_path_on_startup: Optional[Path] = None):
         super().__init__()
         
         self._project_path_on_startup = project_path_on_startup
         self._is_first_activation = True
+        self._has_been_shown = False
         self._next_startup_action: Optional[Callable] = None
+        self._param_combos: Optional[list] = None
+        self._channel_labels_cache: Optional[dict] = None
+        self._sync_blocked_widgets: list[QWidget] = []
+        self._system_info_static: Optional[tuple[str, str]] = None
+        self._debug_export_task: Optional[DebugLogExportTask] = None
+        self._update_check_task: Optional[UpdateCheckTask] = None
+        self._parsed_current_version = None
         
         QApplication.instance().focusWindowChanged.connect(self.handle_focus_changed)
         
@@ -150,13 +315,28 @@ class MainWindow(QWidget):
         self.available_encoders_map = {}
         self.has_validated_once = False
         self.validation_snapshot = {}
+        self.validation_files_digest: Optional[bytes] = None
+        self._validated_param_signature: Optional[tuple] = None
+        self._last_cosmetic_signature: Optional[tuple] = None
+        self._table_state_before_validation: Optional[tuple] = None
+        self._materials_scan_cache: Optional[tuple[tuple[str, int], tuple[str, ...]]] = None
+        self._final_path_cache: Optional[tuple[tuple, Path]] = None
         self.page_count = 0
         self._is_syncing = False
         self.last_validation_messages: ValidationMessages | None = None
+        self._displayed_validation_html: Optional[str] = None
         
         self.parameter_update_timer = QTimer(self)
         self.parameter_update_timer.setSingleShot(True)
         self.parameter_update_timer.timeout.connect(self.on_parameter_changed)
+        self.cosmetic_update_timer = QTimer(self)
+        self.cosmetic_update_timer.setSingleShot(True)
+        self.cosmetic_update_timer.timeout.connect(self.on_cosmetic_parameter_changed)
+        self._log_buffer: list[tuple[str, Optional[QColor]]] = []
+        self.log_flush_timer = QTimer(self)
+        self.log_flush_timer.setSingleShot(True)
+        self.log_flush_timer.setInterval(config.LOG_FLUSH_INTERVAL_MS)
+        self.log_flush_timer.timeout.connect(self._flush_debug_log)
         
         self.ui = Ui_MainWindow()
         self.ui.setupUi(self)
@@ -180,7 +360,12 @@ class MainWindow(QWidget):
         self.gallery_window = None
         self.progress_dialog = None
         self._pending_recent_path = None
-        self.ffmpeg_installed = self.check_ffmpeg_exists()
+        # Resolved off the GUI thread; the encoder test starts as soon as this reports back.
+        self.ffmpeg_installed = False
+        self._ffmpeg_probe_done = False
+        self._ffmpeg_probe = FFmpegProbeTask()
+        self._ffmpeg_probe.signals.finished.connect(self._on_ffmpeg_probe_finished)
+        QThreadPool.globalInstance().start(self._ffmpeg_probe)
         
         self.slide_table.setSelectionBehavior(QAbstractItemView.SelectRows)
 
@@ -193,8 +378,7 @@ class MainWindow(QWidget):
         )
         self.slide_table_manager.log_message.connect(self.write_debug)
 
-        text_color = self.palette().color(QPalette.ColorRole.WindowText)
-        self.current_theme = "dark" if text_color.lightness() > 128 else "light"
+        self.current_theme = self._theme_from_palette()
 
         self._populate_comboboxes()
 
@@ -208,22 +392,49 @@ class MainWindow(QWidget):
 
         self._setup_connections()
         
-        self._setup_licenses_tab()
-        self._setup_font_license_tab()
-        self._setup_thirdparty_license_tab()
-        self._setup_disclaimer_tab()
+        # The license texts are read from disk only when the Licenses tab is first opened.
+        self._licenses_loaded = False
+        self.tabs.currentChanged.connect(self._on_main_tab_changed)
         
         self._sync_model_to_ui()
 
         self.on_state_changed(None, self.state_machine.state)
 
+    def changeEvent(self, event: QEvent):
+        if event.type() == QEvent.Type.LanguageChange:
+            self._channel_labels_cache = None
+        elif event.type() == QEvent.Type.StyleChange:
+            MainWindow._scrollbar_extent = None
+        elif (event.type() == QEvent.Type.PaletteChange and hasattr(self, 'current_theme')
+                and app_settings.get_theme() not in ("light", "dark")):
+            # Follow OS appearance changes while the "system" theme is selected.
+            self._set_current_theme(self._theme_from_palette())
+        super().changeEvent(event)
+
     def showEvent(self, event: QShowEvent):
         super().showEvent(event)
+        if not self._has_been_shown:
+            self._has_been_shown = True
+            self.first_shown.emit()
 
+    @Slot(QWindow)
     def handle_focus_changed(self, focus_window):
          if self._is_first_activation and focus_window is self.windowHandle():
             self._is_first_activation = False
             
+            if self._ffmpeg_probe_done and not self.ffmpeg_installed:
+                self.perform_initial_checks()
+            elif self.worker_manager.current_transient_thread is None:
+                self._run_next_startup_action()
+
+    @Slot(bool)
+    def _on_ffmpeg_probe_finished(self, found: bool):
+        self._ffmpeg_probe_done = True
+        self._ffmpeg_probe = None
+        self.ffmpeg_installed = found
+        # The encoder test needs no visible window, so it overlaps with the first paint;
+        # only the missing-FFmpeg dialog waits for the window to be activated.
+        if found or not self._is_first_activation:
             self.perform_initial_checks()
 
     def perform_initial_checks(self):
@@ -235,12 +446,19 @@ class MainWindow(QWidget):
             QMessageBox.critical(self, self.tr("FFmpeg Not Found"), msg)
             self.state_machine.transition_to(AppState.ERROR)
 
+    @Slot()
     def on_transient_worker_finished(self):
+        # The startup project load may raise dialogs, so it also waits for first activation.
+        if not self._is_first_activation:
+            self._run_next_startup_action()
+
+    def _run_next_startup_action(self):
         if self._next_startup_action:
             action = self._next_startup_action
             self._next_startup_action = None
             action()
 
+    @Slot(str)
     def on_transient_worker_busy(self, message: str):
         # A transient task was requested while one was already running, so the new request
         # was dropped. Its caller may have pushed a wait cursor that no finished-handler will
@@ -255,6 +473,7 @@ class MainWindow(QWidget):
         self.progress_bar.setValue(0)
         self.cancel_button.setEnabled(False)
 
+    @Slot(object, object)
     def on_encoder_test_finished(self, encoders_map, logs):
         self.write_debug("[INFO] \n--- Hardware Encoder Test Finished (Background) ---")
         for log in logs:
@@ -287,11 +506,17 @@ class MainWindow(QWidget):
             self.state_machine.transition_to(AppState.AWAITING_PROJECT)
 
     def check_ffmpeg_exists(self) -> bool:
-        try:
-            get_ffmpeg_path()
-            return True
-        except (FileNotFoundError, ImportError):
-            return False
+        return ffmpeg_pair_available()
+
+    @Slot(int)
+    def _on_main_tab_changed(self, index: int):
+        if self._licenses_loaded or self.tabs.widget(index) is not self.licenses_tab:
+            return
+        self._licenses_loaded = True
+        self._setup_licenses_tab()
+        self._setup_font_license_tab()
+        self._setup_thirdparty_license_tab()
+        self._setup_disclaimer_tab()
 
     def _setup_licenses_tab(self):
         if not bundled_ffmpeg_exists():
@@ -324,7 +549,7 @@ class MainWindow(QWidget):
             lgpl_path = resolve_resource_path("resources/ffmpeg/LGPL.txt")
             if lgpl_path.exists():
                 with open(lgpl_path, 'r', encoding='utf-8') as f:
-                    self.ffmpeg_license_text_edit.setText(f.read())
+                    self.ffmpeg_license_text_edit.setPlainText(f.read())
             else:
                 self.ffmpeg_license_text_edit.setText(self.tr("Bundled ffmpeg/LGPL.txt not found."))
         except Exception as e:
@@ -334,7 +559,7 @@ class MainWindow(QWidget):
             config_path = resolve_resource_path("resources/ffmpeg/ffmpeg_build_config.txt")
             if config_path.exists():
                 with open(config_path, 'r', encoding='utf-8') as f:
-                    self.ffmpeg_build_config_text_edit.setText(f.read())
+                    self.ffmpeg_build_config_text_edit.setPlainText(f.read())
             else:
                 self.ffmpeg_build_config_text_edit.setText(self.tr("Bundled ffmpeg/ffmpeg_build_config.txt not found."))
         except Exception as e:
@@ -355,7 +580,7 @@ class MainWindow(QWidget):
             font_license_path = resolve_resource_path("resources/fonts/OFL.txt")
             if font_license_path.exists():
                 with open(font_license_path, 'r', encoding='utf-8') as f:
-                    self.font_license_text_edit.setText(f.read())
+                    self.font_license_text_edit.setPlainText(f.read())
             else:
                 self.font_license_text_edit.setText(self.tr("Font license file (OFL.txt) not found in resources."))
         except Exception as e:
@@ -367,7 +592,7 @@ class MainWindow(QWidget):
             licenses_path = resolve_resource_path("resources/licenses/THIRD_PARTY_LICENSES.txt")
             if licenses_path.exists():
                 with open(licenses_path, 'r', encoding='utf-8') as f:
-                    self.thirdparty_license_text_edit.setText(f.read())
+                    self.thirdparty_license_text_edit.setPlainText(f.read())
             else:
                 self.thirdparty_license_text_edit.setText(self.tr(
                     "The consolidated third-party library license notices are generated "
@@ -401,7 +626,7 @@ class MainWindow(QWidget):
             "Note: The app itself is licensed under the MIT License. "
             "That license applies to the app only. It does not grant or guarantee any rights in your input materials or in your exported videos."
         )
-        self.disclaimer_text_edit.setText(disclaimer_text)
+        self.disclaimer_text_edit.setPlainText(disclaimer_text)
 
     def _create_menu_bar(self) -> QMenuBar:
         menu_bar = QMenuBar(self)
@@ -483,18 +708,32 @@ class MainWindow(QWidget):
         # Unlike language, theme changes apply immediately: qdarktheme only swaps
         # the application stylesheet, so no UI re-translation is needed.
         QApplication.instance().setStyleSheet(
-            qdarktheme.load_stylesheet(app_settings.theme_to_stylesheet_arg(code)))
+            load_app_stylesheet(app_settings.theme_to_stylesheet_arg(code)))
         app_settings.set_theme(code)
 
         if code in ("light", "dark"):
-            self.current_theme = code
+            self._set_current_theme(code)
         else:
             # "system": resolve the concrete appearance from the palette.
-            text_color = self.palette().color(QPalette.ColorRole.WindowText)
-            self.current_theme = "dark" if text_color.lightness() > 128 else "light"
+            self._set_current_theme(self._theme_from_palette())
+
+    def _show_validation_html(self, html_doc: str):
+        # Re-validating an unchanged project yields the same report; skip the relayout.
+        if html_doc == self._displayed_validation_html:
+            return
+        self._displayed_validation_html = html_doc
+        self.validation_results_text.setHtml(html_doc)
+
+    def _theme_from_palette(self) -> str:
+        text_color = self.palette().color(QPalette.ColorRole.WindowText)
+        return "dark" if text_color.lightness() > 128 else "light"
 
+    def _set_current_theme(self, theme: str):
+        if theme == self.current_theme:
+            return
+        self.current_theme = theme
         if self.last_validation_messages:
-            self.validation_results_text.setHtml(self.last_validation_messages.assemble_html(theme=self.current_theme))
+            self._show_validation_html(self.last_validation_messages.assemble_html(theme=self.current_theme))
 
     def _rebuild_recent_menu(self):
         self.recent_menu.clear()
@@ -547,77 +786,85 @@ class MainWindow(QWidget):
         QDesktopServices.openUrl(url)
 
     def _adjust_combo_box_view_width(self, combo_box: QComboBox):
-        font_metrics = combo_box.fontMetrics()
-        max_width = 0
-        for i in range(combo_box.count()):
-            text = combo_box.itemText(i)
-            width = font_metrics.horizontalAdvance(text)
-            if width > max_width:
-                max_width = width
-        
-        scrollbar_width = QApplication.style().pixelMetric(QStyle.PixelMetric.PM_ScrollBarExtent)
+        if combo_box.count() == 0:
+            return
+        # Character count does not predict rendered width in a proportional font, so measure each label.
+        metrics = combo_box.fontMetrics()
+        max_width = max(metrics.horizontalAdvance(combo_box.itemText(i)) for i in range(combo_box.count()))
+        
+        if MainWindow._scrollbar_extent is None:
+            MainWindow._scrollbar_extent = QApplication.style().pixelMetric(QStyle.PixelMetric.PM_ScrollBarExtent)
         padding = 20 
-        combo_box.view().setMinimumWidth(max_width + scrollbar_width + padding)
+        combo_box.view().setMinimumWidth(max_width + MainWindow._scrollbar_extent + padding)
+
+    def _channel_labels(self) -> dict:
+        if self._channel_labels_cache is None:
+            self._channel_labels_cache = {
+                1: self.tr("1 (Mono)"),
+                2: self.tr("2 (Stereo)"),
+                3: self.tr("3 (Stereo + Center)"),
+                4: self.tr("4 (Quadraphonic)"),
+                5: self.tr("5 (5.0 Surround)"),
+                6: self.tr("6 (5.1 Surround)"),
+                7: self.tr("7 (7.0 Surround)"),
+                8: self.tr("8 (7.1 Surround)")
+            }
+        return self._channel_labels_cache
 
     def _populate_comboboxes(self):
-        self.resolution_combo.clear()
-        self.resolution_combo.addItems(config.RESOLUTION_OPTIONS)
-        
-        self.fps_combo.clear()
-        self.fps_combo.addItems([str(fps) for fps in config.FPS_OPTIONS])
-        
-        self.codec_combo.blockSignals(True)
-        self.codec_combo.clear()
-        available_codecs = sorted(list(self.available_encoders_map.keys()))
-        if available_codecs:
-            self.codec_combo.addItems(available_codecs)
-            self.codec_combo.setEnabled(True)
-        else:
-            # currentText() feeds params.codec, so keep this placeholder English (not a real codec).
-            self.codec_combo.addItem("No Encoders Found")
-            self.codec_combo.setEnabled(False)
-        self.codec_combo.blockSignals(False)
-
-        self.audio_bitrate_combo.clear()
-        self.audio_bitrate_combo.addItems(config.AUDIO_BITRATE_OPTIONS)
-        
-        self.audio_sample_rate_combo.clear()
-        self.audio_sample_rate_combo.addItems(config.AUDIO_SAMPLE_RATE_OPTIONS)
-        
-        self.audio_channels_combo.clear()
-        channel_labels = {
-            1: self.tr("1 (Mono)"),
-            2: self.tr("2 (Stereo)"),
-            3: self.tr("3 (Stereo + Center)"),
-            4: self.tr("4 (Quadraphonic)"),
-            5: self.tr("5 (5.0 Surround)"),
-            6: self.tr("6 (5.1 Surround)"),
-            7: self.tr("7 (7.0 Surround)"),
-            8: self.tr("8 (7.1 Surround)")
-        }
-        ch_low, ch_high = config.AUDIO_CHANNELS_RANGE
-        for i in range(ch_low, ch_high + 1):
-            text = channel_labels.get(i, str(i))
-            self.audio_channels_combo.addItem(text, userData=i)
-        
-        self.watermark_color_combo.clear()
-        self.watermark_color_combo.addItems(config.WATERMARK_COLOR_OPTIONS_RGB.keys())
-        
-        self.watermark_fontfamily_combo.clear()
-        self.watermark_fontfamily_combo.addItems(list(config.BUNDLED_FONTS.keys()))
-        
-        self.watermark_rotation_combo.clear()
-        self.watermark_rotation_combo.addItem(self.tr("None"), "None")
-        self.watermark_rotation_combo.addItem(self.tr("45 Degrees (Clockwise)"), "45")
-        self.watermark_rotation_combo.addItem(self.tr("-45 Degrees (C-Clockwise)"), "-45")
-        
-        self.encoding_mode_combo.clear()
-        self.encoding_mode_combo.addItems(list(config.ENCODING_MODES.values()))
-        
-        self.pass_combo.clear()
-        self.pass_combo.addItems(list(config.ENCODING_PASSES.values()))
+        combos = [
+            self.resolution_combo, self.fps_combo, self.codec_combo,
+            self.audio_bitrate_combo, self.audio_sample_rate_combo, self.audio_channels_combo,
+            self.watermark_color_combo, self.watermark_fontfamily_combo, self.watermark_rotation_combo,
+            self.encoding_mode_combo, self.pass_combo,
+        ]
+        # Callers re-sync the model to the UI afterwards, so the intermediate
+        # clear()/addItems() signals would only trigger redundant slot cascades.
+        self.setUpdatesEnabled(False)
+        previously_blocked = [combo.blockSignals(True) for combo in combos]
+        try:
+            for combo in combos:
+                combo.clear()
+
+            self.resolution_combo.addItems(config.RESOLUTION_OPTIONS)
+            self.fps_combo.addItems([str(fps) for fps in config.FPS_OPTIONS])
+
+            available_codecs = sorted(list(self.available_encoders_map.keys()))
+            if available_codecs:
+                self.codec_combo.addItems(available_codecs)
+                self.codec_combo.setEnabled(True)
+            else:
+                # currentText() feeds params.codec, so keep this placeholder English (not a real codec).
+                self.codec_combo.addItem("No Encoders Found")
+                self.codec_combo.setEnabled(False)
+
+            self.audio_bitrate_combo.addItems(config.AUDIO_BITRATE_OPTIONS)
+            self.audio_sample_rate_combo.addItems(config.AUDIO_SAMPLE_RATE_OPTIONS)
+
+            channel_labels = self._channel_labels()
+            ch_low, ch_high = config.AUDIO_CHANNELS_RANGE
+            channels = range(ch_low, ch_high + 1)
+            self.audio_channels_combo.addItems([channel_labels.get(i, str(i)) for i in channels])
+            for row, i in enumerate(channels):
+                self.audio_channels_combo.setItemData(row, i)
+
+            self.watermark_color_combo.addItems(config.WATERMARK_COLOR_OPTIONS_RGB.keys())
+            self.watermark_fontfamily_combo.addItems(list(config.BUNDLED_FONTS.keys()))
+
+            self.watermark_rotation_combo.addItem(self.tr("None"), "None")
+            self.watermark_rotation_combo.addItem(self.tr("45 Degrees (Clockwise)"), "45")
+            self.watermark_rotation_combo.addItem(self.tr("-45 Degrees (C-Clockwise)"), "-45")
+
+            self.encoding_mode_combo.addItems(list(config.ENCODING_MODES.values()))
+            self.pass_combo.addItems(list(config.ENCODING_PASSES.values()))
+        finally:
+            for combo, was_blocked in zip(combos, previously_blocked):
+                combo.blockSignals(was_blocked)
+            self.setUpdatesEnabled(True)
         
-        for combo in self.parameters_tabs.findChildren(QComboBox):
+        if self._param_combos is None:
+            self._param_combos = self.parameters_tabs.findChildren(QComboBox)
+        for combo in self._param_combos:
             self._adjust_combo_box_view_width(combo)
 
     def _update_hardware_encoding_options(self, codec: str):
@@ -677,9 +924,18 @@ class MainWindow(QWidget):
         params.export_youtube_chapters = self.export_youtube_chapters_checkbox.isChecked()
 
     def _sync_model_to_ui(self):
+        # Widgets whose only listeners are the parameter-update slots are silenced outright;
+        # the codec/mode combos and the loudness checkbox also drive dependent UI, so those
+        # still emit and rely on the _is_syncing guard.
+        previously_blocked = [widget.blockSignals(True) for widget in self._sync_blocked_widgets]
+        self._last_cosmetic_signature = None
         self._is_syncing = True
-        self.ui_manager.sync_model_to_ui(self.project_model.parameters)
-        self._is_syncing = False
+        try:
+            self.ui_manager.sync_model_to_ui(self.project_model.parameters)
+        finally:
+            self._is_syncing = False
+            for widget, was_blocked in zip(self._sync_blocked_widgets, previously_blocked):
+                widget.blockSignals(was_blocked)
 
     def _setup_connections(self):
         self.select_project_folder_button.clicked.connect(self.select_project_folder)
@@ -689,25 +945,25 @@ class MainWindow(QWidget):
         self.create_video_button.clicked.connect(self.run_create_video)
         self.cancel_button.clicked.connect(self.cancel_video_creation)
         
-        self.state_machine.state_changed.connect(self.on_state_changed)
+        self.state_machine.state_changed.connect(self.on_state_changed, Qt.UniqueConnection)
         
         self.codec_combo.currentTextChanged.connect(self.on_codec_changed)
         self.encoding_mode_combo.currentIndexChanged.connect(self.on_encoding_mode_changed)
         
-        self.worker_manager.progress_updated.connect(self.update_progress_bar)
-        self.worker_manager.log_message.connect(self.write_debug)
-        self.worker_manager.video_finished.connect(self.on_video_creation_finished)
-        self.worker_manager.preview_finished.connect(self.on_preview_finished)
+        self.worker_manager.progress_updated.connect(self.update_progress_bar, Qt.UniqueConnection)
+        self.worker_manager.log_message.connect(self.write_debug, Qt.UniqueConnection)
+        self.worker_manager.video_finished.connect(self.on_video_creation_finished, Qt.UniqueConnection)
+        self.worker_manager.preview_finished.connect(self.on_preview_finished, Qt.UniqueConnection)
         
-        self.worker_manager.encoder_test_finished.connect(self.on_encoder_test_finished)
-        self.worker_manager.project_setup_finished.connect(self.on_project_setup_finished)
-        self.worker_manager.project_setup_error.connect(self.on_project_setup_error)
+        self.worker_manager.encoder_test_finished.connect(self.on_encoder_test_finished, Qt.UniqueConnection)
+        self.worker_manager.project_setup_finished.connect(self.on_project_setup_finished, Qt.UniqueConnection)
+        self.worker_manager.project_setup_error.connect(self.on_project_setup_error, Qt.UniqueConnection)
         
-        self.worker_manager.validation_finished.connect(self.on_validation_finished)
-        self.worker_manager.validation_error.connect(self.on_validation_error)
-        self.worker_manager.validation_canceled.connect(self.on_validation_canceled)
-        self.worker_manager.transient_worker_finished.connect(self.on_transient_worker_finished)
-        self.worker_manager.transient_worker_busy.connect(self.on_transient_worker_busy)
+        self.worker_manager.validation_finished.connect(self.on_validation_finished, Qt.UniqueConnection)
+        self.worker_manager.validation_error.connect(self.on_validation_error, Qt.UniqueConnection)
+        self.worker_manager.validation_canceled.connect(self.on_validation_canceled, Qt.UniqueConnection)
+        self.worker_manager.transient_worker_finished.connect(self.on_transient_worker_finished, Qt.UniqueConnection)
+        self.worker_manager.transient_worker_busy.connect(self.on_transient_worker_busy, Qt.UniqueConnection)
         param_widgets_on_change = [
             self.resolution_combo, self.fps_combo, self.hardware_encoding_combo, self.pass_combo,
             self.audio_bitrate_combo, self.audio_sample_rate_combo, self.audio_channels_combo,
@@ -717,11 +973,11 @@ class MainWindow(QWidget):
         param_widgets_on_toggle = [self.normalize_loudness_checkbox]
 
         for widget in param_widgets_on_change:
-            widget.currentIndexChanged.connect(self.on_parameter_changed)
+            widget.currentIndexChanged.connect(self._schedule_parameter_update)
         for widget in param_widgets_on_finish_editing:
-            widget.editingFinished.connect(self.on_parameter_changed)
+            widget.editingFinished.connect(self._schedule_parameter_update)
         for widget in param_widgets_on_toggle:
-            widget.toggled.connect(self.on_parameter_changed)
+            widget.toggled.connect(self._schedule_parameter_update)
 
         self.value_spin.valueChanged.connect(self._request_delayed_parameter_update)
         
@@ -737,12 +993,17 @@ class MainWindow(QWidget):
             self.export_youtube_chapters_checkbox,
         ]
 
+        self._sync_blocked_widgets = (
+            param_widgets_on_change + param_widgets_on_finish_editing
+            + cosmetic_widgets_on_change + cosmetic_widgets_on_finish_editing + cosmetic_widgets_on_toggle
+        )
+
         for widget in cosmetic_widgets_on_change:
-            widget.currentIndexChanged.connect(self.on_cosmetic_parameter_changed)
+            widget.currentIndexChanged.connect(self._schedule_cosmetic_update)
         for widget in cosmetic_widgets_on_finish_editing:
-            widget.editingFinished.connect(self.on_cosmetic_parameter_changed)
+            widget.editingFinished.connect(self._schedule_cosmetic_update)
         for widget in cosmetic_widgets_on_toggle:
-            widget.toggled.connect(self.on_cosmetic_parameter_changed)
+            widget.toggled.connect(self._schedule_cosmetic_update)
         
         self.reset_parameters_button.clicked.connect(self.confirm_reset_parameters)
         
@@ -767,6 +1028,7 @@ class MainWindow(QWidget):
         self.export_debug_button.clicked.connect(self.export_debug_log)
         self.verbose_debug_checkbox.toggled.connect(self.on_verbose_toggled)
 
+    @Slot(bool)
     def on_verbose_toggled(self, checked):
         config.LOG_STATE_TRANSITIONS = checked
         if checked:
@@ -775,110 +1037,116 @@ class MainWindow(QWidget):
             self.write_debug("[INFO] Verbose logging disabled.")
 
     def clear_debug_log(self):
+        self._log_buffer.clear()
         self.debug_text.clear()
 
     def _get_system_info(self):
-        def _bytes_to_gb(bytes_val):
-            return round(bytes_val / (1024 ** 3), 2)
-
-        info_lines = [
-            "================== System Information ==================",
-            f"App Version: {self.__version__}",
-            f"Platform: {platform.platform()}",
-            f"Architecture: {platform.machine()}",
-            f"Python Version: {sys.version}",
-        ]
+        # Platform, CPU, library and FFmpeg details do not change during a session;
+        # only memory, disk usage and the encoder list are collected on every export.
+        if self._system_info_static is None:
+            head, tail = io.StringIO(), io.StringIO()
+            self._write_static_system_info_head(head.write)
+            self._write_static_system_info_tail(tail.write)
+            self._system_info_static = (head.getvalue(), tail.getvalue())
+        static_head, static_tail = self._system_info_static
+
+        buf = io.StringIO()
+        write = buf.write
+        write(static_head)
+        self._write_dynamic_system_info(write)
+        write(static_tail)
+
+        write("----------------- Available Encoders -----------------\n")
+        if self.available_encoders_map:
+            for codec, encoders in sorted(self.available_encoders_map.items()):
+                write(f"  {codec}: {', '.join(encoders)}\n")
+        else:
+            write("No functional encoders detected or test not run yet.\n")
+
+        write("========================================================")
+        
+        return buf.getvalue()
 
-        cpu_info_lines = ["---------------------- CPU -----------------------"]
+    def _write_static_system_info_head(self, write: Callable[[str], object]):
+        write("================== System Information ==================\n")
+        write(f"App Version: {self.__version__}\n")
+        write(f"Platform: {platform.platform()}\n")
+        write(f"Architecture: {platform.machine()}\n")
+        write(f"Python Version: {sys.version}\n")
+
+        write("---------------------- CPU -----------------------\n")
         try:
-            cpu_info_lines.append(f"  Model: {platform.processor()}")
-            cpu_info_lines.append(f"  Physical Cores: {psutil.cpu_count(logical=False)}")
-            cpu_info_lines.append(f"  Logical Cores: {psutil.cpu_count(logical=True)}")
-            cpu_freq = psutil.cpu_freq()
-            if cpu_freq:
-                cpu_info_lines.append(f"  Max Frequency: {cpu_freq.max:.2f} Mhz")
+            write(f"  Model: {platform.processor()}\n")
+            physical_cores, logical_cores, max_freq = _cpu_topology()
+            write(f"  Physical Cores: {physical_cores}\n")
+            write(f"  Logical Cores: {logical_cores}\n")
+            if max_freq is not None:
+                write(f"  Max Frequency: {max_freq:.2f} Mhz\n")
         except Exception as e:
-            cpu_info_lines.append(f"  Could not get detailed CPU info: {e}")
-        info_lines.extend(cpu_info_lines)
+            write(f"  Could not get detailed CPU info: {e}\n")
+
+    def _write_dynamic_system_info(self, write: Callable[[str], object]):
+        import psutil
 
-        memory_info_lines = ["--------------------- Memory ---------------------"]
+        write("--------------------- Memory ---------------------\n")
         try:
             vmem = psutil.virtual_memory()
-            memory_info_lines.append(f"  Total: {_bytes_to_gb(vmem.total)} GB")
-            memory_info_lines.append(f"  Available: {_bytes_to_gb(vmem.available)} GB")
-            memory_info_lines.append(f"  Used: {_bytes_to_gb(vmem.used)} GB ({vmem.percent}%)")
+            write(f"  Total: {_fmt_gb(vmem.total)} GB\n")
+            write(f"  Available: {_fmt_gb(vmem.available)} GB\n")
+            write(f"  Used: {_fmt_gb(vmem.used)} GB ({vmem.percent}%)\n")
         except Exception as e:
-            memory_info_lines.append(f"  Could not get memory info: {e}")
-        info_lines.extend(memory_info_lines)
+            write(f"  Could not get memory info: {e}\n")
         
-        disk_info_lines = ["------------------ Disk Partitions -----------------"]
+        write("------------------ Disk Partitions -----------------\n")
         try:
-            partitions = psutil.disk_partitions()
+            # Skip optical drives and unformatted partitions
+            partitions = [part for part in psutil.disk_partitions()
+                          if part.fstype and 'cdrom' not in part.opts.split(',')]
             for part in partitions:
-                # Skip optical drives and unformatted partitions
-                if 'cdrom' in part.opts or not part.fstype:
-                    continue
-                disk_info_lines.append(f"  Device: {part.device} (Mount: {part.mountpoint}, FSType: {part.fstype})")
+                write(f"  Device: {part.device} (Mount: {part.mountpoint}, FSType: {part.fstype})\n")
                 try:
-                    usage = psutil.disk_usage(part.mountpoint)
-                    disk_info_lines.append(f"    Total: {_bytes_to_gb(usage.total)} GB")
-                    disk_info_lines.append(f"    Used: {_bytes_to_gb(usage.used)} GB ({usage.percent}%)")
-                    disk_info_lines.append(f"    Free: {_bytes_to_gb(usage.free)} GB")
+                    total, used, free, percent = _disk_usage(part.mountpoint)
+                    write(f"    Total: {_fmt_gb(total)} GB\n")
+                    write(f"    Used: {_fmt_gb(used)} GB ({percent}%)\n")
+                    write(f"    Free: {_fmt_gb(free)} GB\n")
                 except Exception:
-                    disk_info_lines.append(f"    Could not retrieve usage for this partition.")
+                    write("    Could not retrieve usage for this partition.\n")
         except Exception as e:
-            disk_info_lines.append(f"  Could not get disk partitions: {e}")
-        info_lines.extend(disk_info_lines)
+            write(f"  Could not get disk partitions: {e}\n")
 
-        libs_info_lines = ["----------------- Library Versions -----------------"]
+    def _write_static_system_info_tail(self, write: Callable[[str], object]):
+        write("----------------- Library Versions -----------------\n")
         libs_to_check = {
             "pypdfium2": pdf_utils.pypdfium2_version(),
-            "Pillow": PIL,
+            "Pillow": _library_version("Pillow", "PIL"),
             "PySide6": PySide6,
-            "toml": toml,
-            "Imagehash": imagehash
+            "toml": _library_version("toml", "toml"),
+            "tomli-w": _library_version("tomli-w", "tomli_w"),
+            "Imagehash": _library_version("ImageHash", "imagehash")
         }
         for name, lib in libs_to_check.items():
             try:
                 version = lib if isinstance(lib, str) else getattr(lib, '__version__', 'N/A')
-                libs_info_lines.append(f"  {name}: {version}")
+                write(f"  {name}: {version}\n")
             except Exception:
-                libs_info_lines.append(f"  {name}: Error getting version")
-        info_lines.extend(libs_info_lines)
+                write(f"  {name}: Error getting version\n")
 
-        info_lines.append("------------------ FFmpeg Information ------------------")
+        write("------------------ FFmpeg Information ------------------\n")
         try:
             ffmpeg_path = get_ffmpeg_path()
-            
-            result = subprocess.run(
-                [str(ffmpeg_path), "-version"], 
-                capture_output=True, text=True, timeout=5, 
-                encoding='utf-8', errors='replace',
-                creationflags=config.SUBPROCESS_CREATION_FLAGS
-            )
-            ffmpeg_version = result.stdout.splitlines()[0].strip() if result.stdout else "N/A"
-            info_lines.append(f"Source: {get_ffmpeg_source()}")
-            info_lines.append(f"Version: {ffmpeg_version}")
-            info_lines.append(f"Path: {str(ffmpeg_path)}")
+            ffmpeg_version = get_tool_version_line(ffmpeg_path) or "N/A"
+            write(f"Source: {get_ffmpeg_source()}\n")
+            write(f"Version: {ffmpeg_version}\n")
+            write(f"Path: {str(ffmpeg_path)}\n")
         except Exception as e:
-            info_lines.append(f"Could not retrieve FFmpeg info: {e}")
-
-        info_lines.append("----------------- Available Encoders -----------------")
-        if self.available_encoders_map:
-            for codec, encoders in sorted(self.available_encoders_map.items()):
-                info_lines.append(f"  {codec}: {', '.join(encoders)}")
-        else:
-            info_lines.append("No functional encoders detected or test not run yet.")
-
-        info_lines.append("========================================================")
-        
-        return "\n".join(info_lines)
+            write(f"Could not retrieve FFmpeg info: {e}\n")
 
     def export_debug_log(self):
         if not self.project_model.output_folder or not self.project_model.output_folder.is_dir():
             QMessageBox.warning(self, self.tr("Output Folder Not Set"), self.tr("Please select a valid output folder before exporting the debug log."))
             return
 
+        self._flush_debug_log()
         log_content = self.debug_text.toPlainText()
         if not log_content.strip():
             QMessageBox.information(self, self.tr("Log is Empty"), self.tr("There is no content to export."))
@@ -895,15 +1163,29 @@ class MainWindow(QWidget):
         )
 
         if file_path_str:
-            try:
-                system_info = self._get_system_info()
-                full_content = f"{system_info}\n\n[Log Start]\n{log_content}"
-                with open(file_path_str, 'w', encoding='utf-8') as f:
-                    f.write(full_content)
-                QMessageBox.information(self, self.tr("Success"), self.tr("Debug log successfully exported to:\n{0}").format(file_path_str))
-            except IOError as e:
-                QMessageBox.critical(self, self.tr("Export Failed"), self.tr("An error occurred while writing the file:\n{0}").format(e))
+            self.export_debug_button.setEnabled(False)
+            QApplication.setOverrideCursor(Qt.WaitCursor)
+            self._debug_export_task = DebugLogExportTask(self._get_system_info, file_path_str, log_content)
+            self._debug_export_task.signals.finished.connect(self._on_debug_export_finished)
+            self._debug_export_task.signals.failed.connect(self._on_debug_export_failed)
+            QThreadPool.globalInstance().start(self._debug_export_task)
+
+    def _end_debug_export(self):
+        QApplication.restoreOverrideCursor()
+        self.export_debug_button.setEnabled(True)
+        self._debug_export_task = None
+
+    @Slot(str)
+    def _on_debug_export_finished(self, file_path_str: str):
+        self._end_debug_export()
+        QMessageBox.information(self, self.tr("Success"), self.tr("Debug log successfully exported to:\n{0}").format(file_path_str))
 
+    @Slot(str)
+    def _on_debug_export_failed(self, error: str):
+        self._end_debug_export()
+        QMessageBox.critical(self, self.tr("Export Failed"), self.tr("An error occurred while writing the file:\n{0}").format(error))
+
+    @Slot(str)
     def on_codec_changed(self, new_codec: str):
         if self._is_syncing or not new_codec or new_codec == "Checking...":
             return
@@ -929,30 +1211,67 @@ class MainWindow(QWidget):
 
         self.on_encoding_mode_changed()
 
+    @Slot()
     def on_encoding_mode_changed(self):
         if self._is_syncing:
             return
         self.update_encoding_options()
         self.parameters_changed_event()
 
+    @Slot()
     def _request_delayed_parameter_update(self):
         if self._is_syncing:
             return
         self.parameter_update_timer.start(config.DURATION_RECALC_DELAY_MS)
 
+    @Slot()
+    def _schedule_parameter_update(self, _=None):
+        # Route every parameter widget through the shared timer so a burst of
+        # changes results in a single model sync and state transition.
+        if self._is_syncing:
+            return
+        self.parameter_update_timer.start(config.PARAMETER_CHANGE_COALESCE_MS)
+
+    @Slot()
+    def _schedule_cosmetic_update(self, _=None):
+        if self._is_syncing:
+            return
+        self.cosmetic_update_timer.start(config.PARAMETER_CHANGE_COALESCE_MS)
+
+    def _param_signature(self) -> tuple:
+        # Flat tuple of the user-editable parameters; available_encoders is probe output.
+        params = self.project_model.parameters
+        return tuple(
+            getattr(params, f.name) for f in dataclasses.fields(params)
+            if f.name != 'available_encoders'
+        )
+
+    @Slot()
     def on_parameter_changed(self):
         if self._is_syncing:
             return
         self._sync_ui_to_model()
+        # Re-selecting a value or leaving a field unedited must not discard a valid validation.
+        if (self.state_machine.state == AppState.VALIDATED
+                and self._param_signature() == self._validated_param_signature):
+            return
         self.parameters_changed_event()
 
+    @Slot()
     def on_cosmetic_parameter_changed(self):
         if self._is_syncing:
             return
         self._sync_ui_to_model()
+        # Focus-out editingFinished and re-selected combos arrive with nothing changed;
+        # re-rendering every watermarked thumbnail for those is wasted work.
+        signature = self._param_signature()
+        if signature == self._last_cosmetic_signature:
+            return
+        self._last_cosmetic_signature = signature
         # Reflect watermark changes in the slide-list thumbnails immediately.
         self.slide_table_manager.refresh_all_thumbnails()
 
+    @Slot(bool)
     def _on_preview_toggled(self, is_checked: bool):
         self.slide_table_manager.toggle_previews(is_checked)
         
@@ -961,7 +1280,7 @@ class MainWindow(QWidget):
         selected_codec = self.codec_combo.currentText()
         hw_encoder_name = self.hardware_encoding_combo.currentData()
         
-        hw_codec_name = config.CODEC_MAP.get(selected_codec, {}).get(hw_encoder_name)
+        hw_codec_name = config.get_hw_encoder_name(selected_codec, hw_encoder_name)
         is_videotoolbox = 'videotoolbox' in (hw_codec_name or '')
 
         self.pass_combo.setEnabled(True)
@@ -1026,12 +1345,14 @@ class MainWindow(QWidget):
         if self.progress_dialog:
             self.progress_dialog.append_log(message)
 
+    @Slot(bool, str)
     def on_ffmpeg_install_finished(self, success, message):
         try:
             if self.progress_dialog:
                 self.progress_dialog._is_running = False
                 self.progress_dialog.close()
             self.ffmpeg_installed = self.check_ffmpeg_exists()
+            self._system_info_static = None
             if success and self.ffmpeg_installed:
                 QMessageBox.information(self, self.tr("Success"), self.tr("FFmpeg was installed successfully!\n\nYou can now proceed to use the application."))
                 self.state_machine.transition_to(AppState.AWAITING_PROJECT)
@@ -1076,6 +1397,7 @@ class MainWindow(QWidget):
         self.settings_manager.pending_dmj_extract_dir = extract_dir
         self._start_project_load(file_to_load)
 
+    @Slot(ProjectModel)
     def on_project_setup_finished(self, loaded_model: ProjectModel):
         if not loaded_model:
             self.on_project_setup_error(self.tr("Load Error"), self.tr("The project model could not be loaded."))
@@ -1091,7 +1413,7 @@ class MainWindow(QWidget):
         self.ui_manager.update_folder_label(self.output_folder_label, self.project_model.output_folder)
         
         self.has_validated_once = False
-        self.validation_results_text.setHtml("")
+        self._show_validation_html("")
         
         # Populate the UI with the loaded data.
         self.slide_table_manager.populate_slide_table_from_model()
@@ -1108,12 +1430,14 @@ class MainWindow(QWidget):
 
         self.state_machine.transition_to(AppState.PROJECT_LOADED_UIPOPULATED)
 
+    @Slot(str, str)
     def on_project_setup_error(self, title, message):
         self.write_debug(f"[ERROR] {title}: {message}")
         QMessageBox.critical(self, title, message)
         self.state_machine.transition_to(AppState.AWAITING_PROJECT)
         QApplication.restoreOverrideCursor()
 
+    @Slot(AppState, AppState)
     def on_state_changed(self,  old_state: AppState, new_state: AppState):
         self.ui_manager.update_ui_for_state(new_state)
 
@@ -1160,7 +1484,10 @@ class MainWindow(QWidget):
     def _find_single_pdf(self, folder: Path) -> Optional[Path]:
         if not folder or not folder.is_dir():
             return None
-        pdfs = list(folder.glob('*.[pP][dD][fF]'))
+        # One directory read; the old '*.[pP][dD][fF]' glob compiled a pattern per call.
+        with os.scandir(folder) as entries:
+            pdfs = [Path(entry.path) for entry in entries
+                    if entry.name.lower().endswith('.pdf') and entry.is_file()]
         if not pdfs:
             raise FileNotFoundError(self.tr("No PDF file found in the selected project folder."))
         if len(pdfs) > 1:
@@ -1170,10 +1497,16 @@ class MainWindow(QWidget):
     def _rescan_available_materials(self):
         if self.project_model and self.project_model.project_folder:
             try:
-                self.project_model.available_materials = sorted([
-                    p.name for p in self.project_model.project_folder.iterdir()
-                    if p.is_file() and p.suffix.lower() in config.SUPPORTED_FORMATS
-                ])
+                folder = self.project_model.project_folder
+                # Adding, removing or renaming an entry bumps the directory mtime, so an
+                # unchanged mtime means the material list is still current.
+                cache_key = (str(folder), folder.stat().st_mtime_ns)
+                if self._materials_scan_cache and self._materials_scan_cache[0] == cache_key:
+                    self.project_model.available_materials = list(self._materials_scan_cache[1])
+                    return
+                materials = scan_material_names(folder)
+                self._materials_scan_cache = (cache_key, tuple(materials))
+                self.project_model.available_materials = materials
             except Exception as e:
                 self.write_debug(f"[ERROR] Error while rescanning material files: {e}")
 
@@ -1183,61 +1516,69 @@ class MainWindow(QWidget):
             QMessageBox.information(self, self.tr("Update Check Skipped"), self.tr("Running in local-dev mode. Update check skipped."))
             return
 
-        self.write_debug("[INFO] --- Manually checking for application updates ---", 'app')
-        repo_url = config.REPO_URL
-        repo_path = repo_url.replace("https://github.com/", "")
-        api_url = f"https://api.github.com/repos/{repo_path}/releases/latest"
+        if self._update_check_task is not None:
+            return
 
-        try:
-            from packaging.version import parse as parse_version
-        except ImportError:
+        if _version_parser() is None:
             self.write_debug("[WARNING] 'packaging' library not found. Skipping update check. Please run 'pip install packaging'.", 'app')
             QMessageBox.warning(self, self.tr("Check Failed"), self.tr("'packaging' library not found. Please run 'pip install packaging'."))
             return
 
-        QApplication.setOverrideCursor(Qt.WaitCursor)
+        self.write_debug("[INFO] --- Manually checking for application updates ---", 'app')
+        repo_url = config.REPO_URL
+        repo_path = repo_url.replace("https://github.com/", "")
+        api_url = f"https://api.github.com/repos/{repo_path}/releases/latest"
 
-        try:
-            # Access GitHub API (timeout set to 5 seconds)
-            req = request.Request(api_url, headers={'Accept': 'application/vnd.github.v3+json'})
-            with request.urlopen(req, timeout=5) as response:
-                if response.status != 200:
-                    raise ConnectionError(f"GitHub API returned status {response.status}")
-                
-                data = json.loads(response.read().decode('utf-8'))
-                latest_version_tag = data.get("tag_name", "v0.0.0").lstrip('v')
-                release_url = data.get("html_url", "")
+        QApplication.setOverrideCursor(Qt.WaitCursor)
+        self._update_check_task = UpdateCheckTask(api_url)
+        self._update_check_task.signals.finished.connect(self._on_update_check_finished)
+        self._update_check_task.signals.failed.connect(self._on_update_check_failed)
+        QThreadPool.globalInstance().start(self._update_check_task)
 
-            self.write_debug(f"[INFO] Current version: {self.__version__}, Latest version on GitHub: {latest_version_tag}", 'app')
+    @Slot(str, str)
+    def _on_update_check_finished(self, latest_version_tag: str, release_url: str):
+        QApplication.restoreOverrideCursor()
+        self._update_check_task = None
+        self.write_debug(f"[INFO] Current version: {self.__version__}, Latest version on GitHub: {latest_version_tag}", 'app')
 
-            QApplication.restoreOverrideCursor()
+        try:
+            parse_version = _version_parser()
+            if self._parsed_current_version is None:
+                self._parsed_current_version = parse_version(self.__version__)
+            is_newer = parse_version(latest_version_tag) > self._parsed_current_version
+        except Exception as e:
+            self._on_update_check_failed(str(e))
+            return
 
-            # Compare versions
-            if parse_version(latest_version_tag) > parse_version(self.__version__):
-                self.write_debug(f"[INFO] New version {latest_version_tag} found!", 'app')
-                
-                # Show notification to the user
-                msg_box = QMessageBox(self)
-                msg_box.setWindowTitle(self.tr("New Version Available"))
-                msg_box.setIcon(QMessageBox.Information)
-                msg_box.setText(
-                    self.tr("A new version <b>{0}</b> has been released.<br><br>"
-                    "You are currently running version {1}.").format(latest_version_tag, self.__version__)
-                )
-                msg_box.setInformativeText(
-                    self.tr("It is recommended to update to the latest version.<br>"
-                    "<a href='{0}'>Open Download Page</a>").format(release_url)
-                )
-                msg_box.setStandardButtons(QMessageBox.Ok)
-                msg_box.exec()
-            else:
-                self.write_debug("[INFO] You are running the latest version.", 'app')
-                QMessageBox.information(self, self.tr("No Updates Found"), self.tr("You are currently running the latest version ({0}).").format(self.__version__))
+        # Compare versions
+        if is_newer:
+            self.write_debug(f"[INFO] New version {latest_version_tag} found!", 'app')
+            
+            # Show notification to the user
+            msg_box = QMessageBox(self)
+            msg_box.setWindowTitle(self.tr("New Version Available"))
+            msg_box.setIcon(QMessageBox.Information)
+            msg_box.setText(
+                self.tr("A new version <b>{0}</b> has been released.<br><br>"
+                "You are currently running version {1}.").format(latest_version_tag, self.__version__)
+            )
+            msg_box.setInformativeText(
+                self.tr("It is recommended to update to the latest version.<br>"
+                "<a href='{0}'>Open Download Page</a>").format(release_url)
+            )
+            msg_box.setStandardButtons(QMessageBox.Ok)
+            msg_box.exec()
+        else:
+            self.write_debug("[INFO] You are running the latest version.", 'app')
+            QMessageBox.information(self, self.tr("No Updates Found"), self.tr("You are currently running the latest version ({0}).").format(self.__version__))
 
-        except Exception as e:
+    @Slot(str)
+    def _on_update_check_failed(self, error: str):
+        if self._update_check_task is not None:
             QApplication.restoreOverrideCursor()
-            self.write_debug(f"[WARNING] Could not check for updates. This may be due to being offline or a network issue. Error: {e}", 'app')
-            QMessageBox.warning(self, self.tr("Update Check Failed"), self.tr("Could not check for updates. This may be due to being offline or a network issue.\n\nError: {0}").format(e))
+            self._update_check_task = None
+        self.write_debug(f"[WARNING] Could not check for updates. This may be due to being offline or a network issue. Error: {error}", 'app')
+        QMessageBox.warning(self, self.tr("Update Check Failed"), self.tr("Could not check for updates. This may be due to being offline or a network issue.\n\nError: {0}").format(error))
 
     def run_validation(self):
         if not self._check_and_handle_pdf_changes():
@@ -1245,29 +1586,33 @@ class MainWindow(QWidget):
 
         self._rescan_available_materials()
         self._sync_ui_to_model()
+        self._table_state_before_validation = self.slide_table_manager.capture_table_state()
         QApplication.setOverrideCursor(Qt.WaitCursor)
         
         self.state_machine.transition_to(AppState.VALIDATING)
         
         self.worker_manager.start_validation(self.validator, self.project_model, self.available_encoders_map)
 
+    @Slot(object, int, dict)
     def on_validation_finished(self, messages: ValidationMessages, page_count: int, snapshot: dict):
+        # Restore the cursor before any dialog below can open.
+        self.on_worker_thread_finished()
+
         if self.state_machine.state != AppState.VALIDATING:
             self.write_debug(f"[INFO] Validation result was ignored because the state was '{self.state_machine.state.name}', not 'VALIDATING'.")
-            self.on_worker_thread_finished()
             return
 
-        self.on_worker_thread_finished()
-
         self.last_validation_messages = messages
         self.page_count = page_count
-        self.validation_results_text.setHtml(messages.assemble_html(theme=self.current_theme))
+        self._show_validation_html(messages.assemble_html(theme=self.current_theme))
 
         validation_had_errors = messages.has_errors()
         if not validation_had_errors:
             self.state_machine.transition_to(AppState.VALIDATED)
 
             self.validation_snapshot = snapshot
+            self.validation_files_digest = self.validator.validated_files_digest
+            self._validated_param_signature = self._param_signature()
             self.has_validated_once = True
 
             self.tabs.setCurrentWidget(self.slide_settings_tab)
@@ -1276,9 +1621,12 @@ class MainWindow(QWidget):
             QMessageBox.critical(self, self.tr("Validation Failed"), self.tr("Errors were found that prevent video creation.\nSee 'Validation Result' tab for details."))
             self.tabs.setCurrentWidget(self.validation_results_tab)
         
-        self.slide_table_manager.populate_slide_table_from_model()
+        # Only rows whose validation-derived data changed are rebuilt.
+        self.slide_table_manager.refresh_after_validation(self._table_state_before_validation)
+        self._table_state_before_validation = None
         self.slide_table_manager.toggle_previews(self.preview_pinp_checkbox.isChecked())
 
+    @Slot(str)
     def on_validation_error(self, error_message: str):
         QMessageBox.critical(self, self.tr("Validation Error"), error_message)
         self.write_debug(f"[ERROR] Validation thread failed: {error_message}")
@@ -1286,27 +1634,37 @@ class MainWindow(QWidget):
         messages = ValidationMessages()
         messages.add_project_error(self.tr("Validation failed with an unexpected error: {0}").format(error_message))
         self.last_validation_messages = messages
-        self.validation_results_text.setHtml(messages.assemble_html(theme=self.current_theme))
+        self._show_validation_html(messages.assemble_html(theme=self.current_theme))
         self.state_machine.transition_to(AppState.READY_TO_VALIDATE)
         
         self.on_worker_thread_finished()
 
+    @Slot()
     def on_validation_canceled(self):
         messages = ValidationMessages()
         messages.add_project_notice(self.tr("Validation was canceled by the user."))
         self.last_validation_messages = messages
-        self.validation_results_text.setHtml(messages.assemble_html(theme=self.current_theme))
+        self._show_validation_html(messages.assemble_html(theme=self.current_theme))
         self.state_machine.transition_to(AppState.READY_TO_VALIDATE)
         
         self.on_worker_thread_finished()
 
     def construct_final_video_path(self, project_model: ProjectModel) -> Path:
+        params = project_model.parameters
+        total_duration = project_model.get_total_duration() if params.append_duration_checkbox else None
+        cache_key = (params.filename_input, total_duration, project_model.project_folder, project_model.output_folder)
+        if self._final_path_cache and self._final_path_cache[0] == cache_key:
+            return self._final_path_cache[1]
+        final_path = self._build_final_video_path(project_model, total_duration)
+        self._final_path_cache = (cache_key, final_path)
+        return final_path
+
+    def _build_final_video_path(self, project_model: ProjectModel, total_duration: Optional[float]) -> Path:
         filename_input = project_model.parameters.filename_input
         sanitized_filename = Path(filename_input).name if filename_input.strip() else ""
         if not sanitized_filename:
             sanitized_filename = project_model.project_folder.name if project_model.project_folder else "output"
-        if project_model.parameters.append_duration_checkbox:
-            total_duration = sum(s.duration for s in project_model.slides) + sum(s.interval_to_next for s in project_model.slides[:-1])
+        if total_duration is not None:
             minutes = int(total_duration // 60)
             secs = int(round(total_duration % 60))
             duration_str = f"{minutes}m{secs}s" if minutes > 0 else f"{secs}s"
@@ -1394,9 +1752,11 @@ class MainWindow(QWidget):
         
         self.progress_bar.setValue(0)
 
+    @Slot(bool, str)
     def on_video_creation_finished(self, success: bool, message: str):
         self._on_processing_finished(success, message, self.tr("Video"))
     
+    @Slot(bool, str)
     def on_preview_finished(self, success: bool, message: str):
         self._on_processing_finished(success, message, self.tr("Preview"))
 
@@ -1408,11 +1768,13 @@ class MainWindow(QWidget):
         self.ui_manager.update_folder_label(self.project_folder_label, None)
         self.ui_manager.update_folder_label(self.output_folder_label, None)
         self.filename_input.setText("")
-        self.validation_results_text.setHtml("")
+        self._show_validation_html("")
         self.total_duration_label.setText(self.tr("Total Estimated Duration: 0s"))
         self.has_validated_once = False
         self.last_validation_messages = None
         self.validation_snapshot = {}
+        self.validation_files_digest = None
+        self._validated_param_signature = None
 
     def select_project_folder(self, force_folder: Path = None):
         folder_path = None
@@ -1443,17 +1805,19 @@ class MainWindow(QWidget):
         try:
             page_count = pdf_utils.page_count(pdf_path)
             project_model.slides = [Slide() for _ in range(page_count)]
-            project_model.available_materials = sorted([
-                p.name for p in project_model.project_folder.iterdir()
-                if p.is_file() and p.suffix.lower() in config.SUPPORTED_FORMATS
-            ])
+            project_model.available_materials = scan_material_names(project_model.project_folder)
             return pdf_path
         except Exception as e:
             raise ValueError(f"Failed to read PDF file '{pdf_path.name}': {e}")
             
     def _automap_materials(self, project_model: ProjectModel):
-        for material_name in project_model.available_materials:
-            match = re.match(r'\[(\d{3})\]', material_name)
+        # available_materials is sorted, so every "[..." name sits in one contiguous run
+        # between '[' and the next code point (a backslash).
+        materials = project_model.available_materials
+        start = bisect.bisect_left(materials, '[')
+        end = bisect.bisect_left(materials, '\\', start)
+        for material_name in materials[start:end]:
+            match = _AUTOMAP_RE.match(material_name)
             if match:
                 slide_index = int(match.group(1)) - 1
                 if 0 <= slide_index < len(project_model.slides) and project_model.slides[slide_index].filename is None:
@@ -1585,53 +1949,62 @@ class MainWindow(QWidget):
             else:
                  self.state_machine.transition_to(AppState.PREPARE_TO_VALIDATE)
 
+    @Slot(str)
+    @Slot(str, str)
     def write_debug(self, text, source='app'):
-        color_map = {
-            '[FATAL]': QColor("red"),
-            '[ERROR]': QColor("red"),
-            '[WARNING]': QColor("orange"),
-            '[SUCCESS]': QColor("green"),
-            '[DEBUG]': QColor("blue"),
-            '[STATE_TRANSITION]': QColor("magenta"),
-        }
-        default_color = self.debug_text.palette().color(QPalette.ColorRole.Text)
-        ffmpeg_color = QColor("grey")
-
-        is_verbose_log = text.strip().startswith(('[DEBUG]', '[STATE_TRANSITION]'))
+        # Prefixes sit at the start of the line; look at a short head instead of
+        # stripping whole (possibly long) FFmpeg lines.
+        head = text[:32].lstrip()
+        is_verbose_log = head.startswith(_VERBOSE_LOG_PREFIXES)
         if (source == 'ffmpeg' or is_verbose_log) and not self.verbose_debug_checkbox.isChecked():
             return
 
-        self.debug_text.moveCursor(QTextCursor.End)
-        cursor = self.debug_text.textCursor()
-        char_format = QTextCharFormat()
-        
         final_text = text
-        log_color = default_color
+        log_color = None
 
         if source == 'ffmpeg':
-            log_color = ffmpeg_color
+            log_color = _FFMPEG_LOG_COLOR
         else:
             timestamp = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
             final_text = f"[{timestamp}] {text}"
             
-            stripped_text = text.strip()
-            for prefix, color in color_map.items():
-                if stripped_text.startswith(prefix):
-                    log_color = color
-                    break
-        
-        char_format.setForeground(log_color)
-        cursor.setCharFormat(char_format)
-        cursor.insertText(final_text.rstrip() + '\n')
-
-        default_format = QTextCharFormat()
-        cursor.setCharFormat(default_format)
+            if head.startswith('['):
+                for prefix, color in _LOG_PREFIX_COLORS:
+                    if head.startswith(prefix):
+                        log_color = color
+                        break
+
+        # Lines are inserted in batches; verbose FFmpeg output would otherwise relayout
+        # the log document once per line.
+        self._log_buffer.append((final_text.rstrip() + '\n', log_color))
+        if not self.log_flush_timer.isActive():
+            self.log_flush_timer.start()
+
+    def _flush_debug_log(self):
+        if not self._log_buffer:
+            return
+        buffered, self._log_buffer = self._log_buffer, []
+        default_color = self.debug_text.palette().color(QPalette.ColorRole.Text)
 
+        self.debug_text.moveCursor(QTextCursor.End)
+        cursor = self.debug_text.textCursor()
+        cursor.beginEditBlock()
+        for line, log_color in buffered:
+            char_format = QTextCharFormat()
+            char_format.setForeground(log_color if log_color is not None else default_color)
+            cursor.insertText(line, char_format)
+        cursor.endEditBlock()
+
+    @Slot(int)
     def update_progress_bar(self, value):
         self.progress_bar.setValue(value)
 
     def _check_project_files_changed(self) -> bool:
         if self.project_model.project_folder:
+            # Matching sizes and mtimes mean nothing was touched; hash only on a mismatch.
+            if (self.validation_files_digest is not None
+                    and self.validator.project_files_digest(self.project_model.project_folder) == self.validation_files_digest):
+                return True
             current_snapshot = self._gather_project_file_hashes(self.project_model.project_folder)
             if not self.validation_snapshot == current_snapshot:
                 QMessageBox.warning(self, self.tr('Project Folder Changed'),
@@ -1644,19 +2017,18 @@ class MainWindow(QWidget):
     def _gather_project_file_hashes(self, folder: Path) -> dict:
         if not folder: return {}
         snapshot = {}
-        all_formats = config.SUPPORTED_FORMATS + ('.pdf',)
-        for entry in folder.iterdir():
-            if entry.is_file() and entry.suffix.lower() in all_formats:
-                try:
-                    snapshot[entry.name] = self.validator._get_file_hash(entry)
-                except (IOError, OSError) as e:
-                    self.write_debug(f"[WARNING] Could not calculate hash for file {entry.name}: {e}")
-                    snapshot[entry.name] = None
+        for name, result in self.validator.hash_project_files(folder):
+            if isinstance(result, OSError):
+                self.write_debug(f"[WARNING] Could not calculate hash for file {name}: {result}")
+                snapshot[name] = None
+            else:
+                snapshot[name] = result
         return snapshot
 
-    def _format_elapsed_time(self, seconds):
-        h, rem = divmod(int(seconds), 3600)
-        m, s = divmod(rem, 60)
+    @staticmethod
+    def _format_elapsed_time(seconds):
+        m, s = divmod(int(seconds), 60)
+        h, m = divmod(m, 60)
         if h > 0: return f"{h}h {m}m {s}s"
         if m > 0: return f"{m}m {s}s"
         return f"{s}s"
@@ -1666,26 +2038,29 @@ class MainWindow(QWidget):
         if not selected_rows:
             return
 
+        rows = sorted(index.row() for index in selected_rows)
+        last_row = self.slide_table.rowCount() - 1
+
         slide_info_list = []
-        for r in sorted(selected_rows, key=lambda item: item.row()):
-            slide_index = r.row()
+        has_video_slides = has_non_video_slides = False
+        for slide_index in rows:
             slide = self.project_model.slides[slide_index]
             slide_type = "unassigned"
             if slide.is_video:
                 slide_type = "movie"
-            elif slide.filename == config.SILENT_MATERIAL_NAME:
-                slide_type = "silent"
-            elif slide.filename is not None:
-                slide_type = "audio"
+                has_video_slides = True
+            else:
+                has_non_video_slides = True
+                if slide.filename == config.SILENT_MATERIAL_NAME:
+                    slide_type = "silent"
+                elif slide.filename is not None:
+                    slide_type = "audio"
             
             slide_info_list.append({"number": slide_index + 1, "type": slide_type})
         
-        has_video_slides = any(s["type"] == "movie" for s in slide_info_list)
-        has_non_video_slides = not all(s["type"] == "movie" for s in slide_info_list)
         is_mixed_selection = has_video_slides and has_non_video_slides
 
-        is_only_last_slide_selected = (len(selected_rows) == 1 and 
-                                       selected_rows[0].row() == self.slide_table.rowCount() - 1)
+        is_only_last_slide_selected = rows == [last_row]
         
         dialog = EditSlidesDialog(slide_info_list, has_video_slides, is_mixed_selection, is_only_last_slide_selected, self)
         
@@ -1696,13 +2071,10 @@ class MainWindow(QWidget):
 
             self.slide_table.blockSignals(True)
             try:
-                for row_item in selected_rows:
-                    slide_index = row_item.row()
+                for slide_index in rows:
                     slide = self.project_model.slides[slide_index]
 
-                    is_last_slide = (slide_index == self.slide_table.rowCount() - 1)
-
-                    if not is_last_slide:
+                    if slide_index != last_row:
                         if 'transition_to_next' in changes:
                             slide.transition_to_next = changes['transition_to_next']
                         if 'interval_to_next' in changes:
@@ -1714,7 +2086,7 @@ class MainWindow(QWidget):
                         if 'video_scale' in changes:
                             slide.video_scale = changes['video_scale']
                         if 'video_effects' in changes:
-                            slide.video_effects = changes['video_effects']
+                            slide.video_effects = list(changes['video_effects'])
             finally:
                 self.slide_table.blockSignals(False)
 
@@ -1728,39 +2100,33 @@ class MainWindow(QWidget):
             self.slide_table.selectAll()
 
     def select_video_slides(self):
-        selection_model = self.slide_table.selectionModel()
-        selection_model.clear()
-        
-        selection = QItemSelection()
-        model = self.slide_table.model()
-
-        for i, slide in enumerate(self.project_model.slides):
-            if slide.is_video:
-                top_left = model.index(i, 0)
-                bottom_right = model.index(i, self.slide_table.columnCount() - 1)
-                selection.select(top_left, bottom_right)
-        
-        selection_model.select(selection, QItemSelectionModel.Select)
+        self._select_slides_where(lambda slide: slide.is_video)
 
     def select_audio_slides(self):
-        selection_model = self.slide_table.selectionModel()
-        selection_model.clear()
+        self._select_slides_where(lambda slide: (
+            slide.filename is not None and
+            not slide.is_video and
+            material_suffix(slide.filename) in config.SUPPORTED_AUDIO_FORMATS_SET
+        ))
 
+    def _select_slides_where(self, predicate: Callable[[Slide], bool]):
         selection = QItemSelection()
         model = self.slide_table.model()
-        
+        last_col = self.slide_table.columnCount() - 1
+
+        # One range per run of consecutive matching rows rather than one per row.
+        run_start = None
         for i, slide in enumerate(self.project_model.slides):
-            is_audio_only = (
-                slide.filename is not None and
-                not slide.is_video and
-                slide.filename.lower().endswith(config.SUPPORTED_AUDIO_FORMATS)
-            )
-            if is_audio_only:
-                top_left = model.index(i, 0)
-                bottom_right = model.index(i, self.slide_table.columnCount() - 1)
-                selection.select(top_left, bottom_right)
-        
-        selection_model.select(selection, QItemSelectionModel.Select)
+            if predicate(slide):
+                if run_start is None:
+                    run_start = i
+            elif run_start is not None:
+                selection.select(model.index(run_start, 0), model.index(i - 1, last_col))
+                run_start = None
+        if run_start is not None:
+            selection.select(model.index(run_start, 0), model.index(len(self.project_model.slides) - 1, last_col))
+
+        self.slide_table.selectionModel().select(selection, QItemSelectionModel.ClearAndSelect)
 
     def _ffmpeg_missing_message(self) -> str:
         base_message = self.tr("A matching pair of ffmpeg and ffprobe executables was not found. This application requires FFmpeg.")
@@ -1823,7 +2189,7 @@ class MainWindow(QWidget):
             if msg_box.clickedButton() == migrate_button:
                 return self._migrate_slide_data(pdf_path)
             elif msg_box.clickedButton() == reinit_button:
-                self._initialize_new_project(pdf_path)
+                self._initialize_new_project(pdf_path, new_page_count or None)
                 return True
             else:
                 self._cancel_folder_selection()
@@ -1839,7 +2205,7 @@ class MainWindow(QWidget):
              self.validator.validated_pdf_hash = current_pdf_hash
         else:
             if old_page_count == 0:
-                self._initialize_new_project(pdf_path)
+                self._initialize_new_project(pdf_path, new_page_count or None)
             else:
                 self.write_debug("[INFO] New project loaded. No previous PDF state to compare against.")
         
@@ -1850,12 +2216,14 @@ class MainWindow(QWidget):
         self._clear_project()
         self.state_machine.transition_to(AppState.AWAITING_PROJECT)
 
-    def _initialize_new_project(self, pdf_path: Path):
+    def _initialize_new_project(self, pdf_path: Path, page_count: Optional[int] = None):
         self.write_debug("[INFO] Initializing new project from PDF.")
         self.project_model.slides.clear()
         
         try:
-            page_count = pdf_utils.page_count(pdf_path)
+            # Callers that already parsed the PDF structure pass its page count along.
+            if page_count is None:
+                page_count = pdf_utils.page_count(pdf_path)
             self.project_model.slides = [Slide() for _ in range(page_count)]
             self._rescan_available_materials()
             
@@ -1868,7 +2236,9 @@ class MainWindow(QWidget):
 
     def _migrate_slide_data(self, pdf_path: Path) -> bool:
         self.write_debug("[INFO] Starting slide data migration process.")
-        old_slides = copy.deepcopy(self.project_model.slides)
+        # PageMappingDialog only reads the old slides and the migration clones each mapped
+        # slide, so the original list can be restored as-is if the user cancels.
+        old_slides = self.project_model.slides
         
         new_pdf_details, error = self.validator.get_pdf_details(pdf_path)
         if error:
@@ -1905,7 +2275,7 @@ class MainWindow(QWidget):
 
         for new_idx, old_idx in mapping.items():
             if old_idx is not None and 0 <= old_idx < len(old_slides):
-                migrated_slides[new_idx] = copy.deepcopy(old_slides[old_idx])
+                migrated_slides[new_idx] = old_slides[old_idx].clone()
 
         for i in range(new_page_count):
             migrated_slides[i].p_hash = new_pdf_details["p_hashes"][i]
@@ -1,19 +1,71 @@
 # settings_manager.py
 import toml
+try:
+    import tomllib
+except ImportError:  # Python 3.10
+    tomllib = None
+try:
+    import tomli_w
+except ImportError:
+    tomli_w = None
 from pathlib import Path
 from PySide6.QtWidgets import QFileDialog, QMessageBox
 from PySide6.QtCore import QStandardPaths, QObject, Signal
 import hashlib
-from dataclasses import asdict
+import json
+from dataclasses import fields
 
 from ssmm.models import ProjectModel, ProjectParameters, Slide
 from ssmm import config
 from ssmm import dougameijin_importer
 from ssmm import pdf_utils
+from ssmm.utils import material_suffix, scan_material_names
 
 class SettingsFileParseError(ValueError):
     pass
 
+def _drop_none(value):
+    # TOML cannot store None, so such keys are absent after a round trip; drop them
+    # here too so the hash of the saved data matches the hash of the reloaded file.
+    if isinstance(value, dict):
+        return {k: _drop_none(v) for k, v in value.items() if v is not None}
+    if isinstance(value, list):
+        return [_drop_none(v) for v in value]
+    return value
+
+def _canonical_json(value) -> bytes:
+    return json.dumps(
+        _drop_none(value), sort_keys=True, separators=(',', ':'), ensure_ascii=False, default=str,
+    ).encode('utf-8')
+
+def _pdf_matches_fingerprint(pdf_path: Path, validation_info: dict) -> bool:
+    # True if the PDF still has the size and mtime recorded when it was last validated.
+    try:
+        st = pdf_path.stat()
+    except OSError:
+        return False
+    return (st.st_size == validation_info.get("pdf_size")
+            and st.st_mtime_ns == validation_info.get("pdf_mtime_ns"))
+
+def _read_toml(file_path: Path) -> dict:
+    # Prefer the faster stdlib parser on 3.11+. Fall back to the 'toml' package on 3.10,
+    # and for any file written by 'toml' that the stricter tomllib rejects.
+    if tomllib is not None:
+        try:
+            with open(file_path, 'rb') as f:
+                return tomllib.load(f)
+        except tomllib.TOMLDecodeError:
+            pass
+    with open(file_path, 'r', encoding='utf-8') as f:
+        return toml.load(f)
+
+def _dump_toml(data: dict) -> str:
+    # Prefer tomli_w's faster writer when it is installed. It rejects None, which the
+    # 'toml' package silently omits, so drop those keys first to write the same document.
+    if tomli_w is not None:
+        return tomli_w.dumps(_drop_none(data))
+    return toml.dumps(data)
+
 class SettingsManager(QObject):
     log_message = Signal(str, str)
 
@@ -89,8 +141,7 @@ class SettingsManager(QObject):
     def _load_from_file(self, file_path: Path, project_folder_override: Path | None = None) -> ProjectModel | None:
         self.log_message.emit(f"[INFO] Attempting to load project settings from: {file_path}", 'app')
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                data = toml.load(f)
+            data = _read_toml(file_path)
         except (toml.TomlDecodeError, UnicodeDecodeError) as e:
             raise SettingsFileParseError(f"The settings file '{file_path.name}' is not a valid TOML file or is corrupt: {e}")
 
@@ -105,8 +156,9 @@ class SettingsManager(QObject):
         stored_hash = loaded_params_dict.get('integrity_hash')
         if stored_hash:
             try:
-                recomputed_hash = self._compute_integrity_hash(loaded_params_dict, data.get("slides", []))
-                if recomputed_hash != stored_hash:
+                loaded_slides = data.get("slides", [])
+                if (self._compute_integrity_hash(loaded_params_dict, loaded_slides) != stored_hash
+                        and self._compute_legacy_integrity_hash(loaded_params_dict, loaded_slides) != stored_hash):
                     self.log_message.emit("[WARNING] Settings file integrity check failed; the file may have been manually edited or corrupted. Loading anyway.", 'app')
             except Exception as e:
                 self.log_message.emit(f"[WARNING] Could not verify settings file integrity: {e}", 'app')
@@ -131,10 +183,20 @@ class SettingsManager(QObject):
 
         toml_slide_count = len(data.get("slides", []))
 
-        try:
-            pdf_page_count = pdf_utils.page_count(pdf_path)
-        except Exception as e:
-            raise ValueError(f"Failed to read the PDF file '{pdf_path.name}': {e}")
+        pdf_unchanged = _pdf_matches_fingerprint(pdf_path, validation_info)
+        if pdf_unchanged and cached_pdf_hash:
+            # The stored digest still describes this file, so the next hash check need not reread it.
+            self.main_window.validator.remember_file_hash(
+                pdf_path, cached_pdf_hash, validation_info["pdf_size"], validation_info["pdf_mtime_ns"])
+
+        pdf_page_count = validation_info.get("pdf_page_count") if pdf_unchanged else None
+        if pdf_page_count:
+            self.log_message.emit(f"[INFO] PDF is unchanged since it was validated; using the stored page count ({pdf_page_count}).", 'app')
+        else:
+            try:
+                pdf_page_count = pdf_utils.page_count(pdf_path)
+            except Exception as e:
+                raise ValueError(f"Failed to read the PDF file '{pdf_path.name}': {e}")
 
         if toml_slide_count != pdf_page_count:
             self.log_message.emit(f"[WARNING] Page count in TOML ({toml_slide_count}) differs from PDF ({pdf_page_count}). Migration will be required.", 'app')
@@ -153,26 +215,30 @@ class SettingsManager(QObject):
         self._coerce_and_validate_parameters(project_model.parameters)
 
         loaded_slides_settings = data.get("slides", [])
-        
-        project_model.slides = [Slide() for _ in range(toml_slide_count)]
-        
-        project_model.available_materials = sorted([
-            p.name for p in project_model.project_folder.iterdir()
-            if p.is_file() and p.suffix.lower() in config.SUPPORTED_FORMATS
-        ])
 
+        project_model.available_materials = scan_material_names(project_model.project_folder)
+
+        # Build each Slide from its loaded values instead of pre-sizing the list with defaults
+        # and overwriting them field by field. Loop invariants are bound once, and material
+        # lookups hit a set instead of scanning the list.
+        silent_name = config.SILENT_MATERIAL_NAME
+        default_interval = config.DEFAULT_SLIDE_INTERVAL
+        default_scale = config.DEFAULT_VIDEO_SCALE
+        video_suffixes = config.SUPPORTED_VIDEO_FORMATS_SET
+        available_materials = set(project_model.available_materials)
+        slides = []
+        append_slide = slides.append
         for idx, slide_settings in enumerate(loaded_slides_settings):
-            if idx >= len(project_model.slides):
-                break
-
-            slide = project_model.slides[idx]
-            material = slide_settings.get("material")
-
-            if material == config.SILENT_MATERIAL_NAME:
-                slide.filename = config.SILENT_MATERIAL_NAME
-                slide.duration = slide_settings.get("duration", 0)
-            elif material in project_model.available_materials:
-                slide.filename = material
+            get = slide_settings.get
+            material = get("material")
+            filename = None
+            duration = 0.0
+
+            if material == silent_name:
+                filename = silent_name
+                duration = get("duration", 0)
+            elif material in available_materials:
+                filename = material
             elif material:
                 # The saved material is no longer present in the project folder; leave the
                 # slide unassigned (validation will flag it) but tell the user why.
@@ -180,19 +246,26 @@ class SettingsManager(QObject):
                     f"[WARNING] Material '{material}' referenced by slide {idx + 1} was not found "
                     f"in the project folder; the slide will be left unassigned.", 'app')
 
-            slide.chapter_title = slide_settings.get("chapter_title", "")
-            slide.interval_to_next = slide_settings.get("interval_to_next", config.DEFAULT_SLIDE_INTERVAL)
-            slide.transition_to_next = slide_settings.get("transition_to_next", "None")
-            slide.is_video = slide.filename is not None and slide.filename.lower().endswith(config.SUPPORTED_VIDEO_FORMATS)
-            slide.selected_audio_stream_index = slide_settings.get("selected_audio_stream_index", 0)
-            
-            slide.p_hash = slide_settings.get("p_hash")
-            slide.thumbnail_b64 = slide_settings.get("thumbnail_b64")
-
-            if slide.is_video:
-                slide.video_position = slide_settings.get("video_position", "Center")
-                slide.video_scale = slide_settings.get("video_scale", config.DEFAULT_VIDEO_SCALE)
-                slide.video_effects = slide_settings.get("video_effects", [])
+            is_video = filename is not None and material_suffix(filename) in video_suffixes
+            video_settings = {
+                "video_position": get("video_position", "Center"),
+                "video_scale": get("video_scale", default_scale),
+                "video_effects": get("video_effects", []),
+            } if is_video else {}
+
+            append_slide(Slide(
+                filename=filename,
+                duration=duration,
+                is_video=is_video,
+                chapter_title=get("chapter_title", ""),
+                interval_to_next=get("interval_to_next", default_interval),
+                transition_to_next=get("transition_to_next", "None"),
+                selected_audio_stream_index=get("selected_audio_stream_index", 0),
+                p_hash=get("p_hash"),
+                thumbnail_b64=get("thumbnail_b64"),
+                **video_settings,
+            ))
+        project_model.slides = slides
 
         self.log_message.emit(f"[SUCCESS] Successfully loaded project settings.", 'app')
         return project_model
@@ -204,6 +277,26 @@ class SettingsManager(QObject):
             k: v for k, v in params_dict.items()
             if k not in ('integrity_hash', 'available_encoders')
         }
+        # Feed the canonical document to the hasher one slide at a time; the byte stream is
+        # identical to json.dumps of {'parameters': ..., 'slides': [...]} with sorted keys.
+        hasher = hashlib.sha256()
+        hasher.update(b'{"parameters":')
+        hasher.update(_canonical_json(hashable_params))
+        hasher.update(b',"slides":[')
+        for i, slide in enumerate(slides_list):
+            if i:
+                hasher.update(b',')
+            hasher.update(_canonical_json({k: v for k, v in slide.items() if k != 'thumbnail_b64'}))
+        hasher.update(b']}')
+        return hasher.hexdigest()
+
+    @staticmethod
+    def _compute_legacy_integrity_hash(params_dict: dict, slides_list: list) -> str:
+        # Files saved before the JSON canonical form hashed the TOML text instead.
+        hashable_params = {
+            k: v for k, v in params_dict.items()
+            if k not in ('integrity_hash', 'available_encoders')
+        }
         hashable_slides = [
             {k: v for k, v in slide.items() if k != 'thumbnail_b64'}
             for slide in slides_list
@@ -333,10 +426,13 @@ class SettingsManager(QObject):
 
             slides_data.append(slide_entry)
 
-        params_to_save = asdict(project_model.parameters)
-
-        if 'available_encoders' in params_to_save:
-            del params_to_save['available_encoders']
+        # A shallow copy is enough: every persisted parameter is a scalar, and the only
+        # nested field, the encoder map, is never saved.
+        params = project_model.parameters
+        params_to_save = {
+            f.name: getattr(params, f.name) for f in fields(params)
+            if f.name != 'available_encoders'
+        }
 
         try:
             # Hash the persisted representation so the value can be verified on load.
@@ -349,6 +445,7 @@ class SettingsManager(QObject):
         validation_data = {
             "pdf_file_hash": self.main_window.validator.validated_pdf_hash or ""
         }
+        validation_data.update(self.main_window.validator.validated_pdf_fingerprint())
 
         final_toml_data = {
             "config_version": self.main_window.__version__,
@@ -366,9 +463,11 @@ class SettingsManager(QObject):
         )
 
         try:
+            # Serialize first so the file is written in one call, and is not left truncated
+            # if serialization fails.
+            file_text = warning_comment + _dump_toml(final_toml_data)
             with open(file_path, 'w', encoding='utf-8') as f:
-                f.write(warning_comment)
-                toml.dump(final_toml_data, f)
+                f.write(file_text)
 
             QMessageBox.information(self.main_window, self.tr("Success"), self.tr("Project settings saved to:\n{0}").format(file_path))
         except IOError as e:
@@ -1,5 +1,4 @@
 # slide_table_manager.py
-import base64
 from functools import partial
 from contextlib import contextmanager
 from typing import Callable
@@ -8,14 +7,14 @@ from PySide6.QtWidgets import (QTableWidget, QLabel, QComboBox, QLineEdit,
                                QSpinBox, QTableWidgetItem, QHeaderView, QMessageBox,
                                QWidget, QPushButton, QDialog)
 from PySide6.QtCore import QObject, Qt, Signal, QTimer
-from PySide6.QtGui import QPixmap, QImage
 
 from ssmm import config
 from ssmm.models import ProjectModel, Slide
 from ssmm.validator import ProjectValidator
-from ssmm.ui_helpers import calculate_pinp_geometry, superimpose_pinp_info, render_pdf_page_to_pixmap, superimpose_watermark
+from ssmm.ui_helpers import calculate_pinp_geometry, superimpose_pinp_info, render_pdf_page_to_pixmap, superimpose_watermark, pixmap_from_b64_png
 from ssmm.ui_main import wrap_cell_widget, ClickableLabel, NoWheelComboBox, NoWheelSpinBox
 from ssmm.ui_dialogs import EditEffectsDialog, SlidePreviewDialog, MediaPlayerDialog
+from ssmm.utils import material_suffix
 
 @contextmanager
 def block_signals(widget: QWidget):
@@ -68,6 +67,37 @@ class SlideTableManager(QObject):
         self._build_slide_table()
         self.calculate_and_display_total_duration()
 
+    def capture_table_state(self) -> tuple:
+        # Structure decides whether rows must be rebuilt; per-row state decides which
+        # validation-dependent cells (duration, audio stream, PinP) need refreshing.
+        structure = (
+            tuple(self.project_model.available_materials),
+            tuple((s.filename, s.thumbnail_b64) for s in self.project_model.slides),
+        )
+        rows = [self._row_state(s) for s in self.project_model.slides]
+        return structure, rows
+
+    @staticmethod
+    def _row_state(slide: Slide) -> tuple:
+        return (slide.duration, bool(slide.tech_info), slide.is_video, list(slide.audio_streams))
+
+    def refresh_after_validation(self, previous_state: tuple | None):
+        if previous_state is None:
+            self.populate_slide_table_from_model()
+            return
+
+        self.update_slide_info_from_cache()
+        structure, rows = self.capture_table_state()
+        previous_structure, previous_rows = previous_state
+        if structure != previous_structure or self.table.rowCount() != len(rows):
+            self._build_slide_table()
+        else:
+            with block_signals(self.table):
+                for idx, (row, previous_row) in enumerate(zip(rows, previous_rows)):
+                    if row != previous_row:
+                        self._update_slide_table_row_widgets(idx, self.project_model.slides[idx])
+        self.calculate_and_display_total_duration()
+
     def clear_caches(self):
         self.thumbnail_cache.clear()
         for timer in self.timers.values():
@@ -151,7 +181,7 @@ class SlideTableManager(QObject):
             )
             return
 
-        is_video = slide.is_video or slide.filename.lower().endswith(config.SUPPORTED_VIDEO_FORMATS)
+        is_video = slide.is_video or material_suffix(slide.filename) in config.SUPPORTED_VIDEO_FORMATS_SET
         dialog = MediaPlayerDialog(material_path, is_video, parent=self.table)
         dialog.exec()
 
@@ -171,10 +201,7 @@ class SlideTableManager(QObject):
                 # Thumbnail (Column 0): Base64 cache from the Slide model
                 if slide.thumbnail_b64:
                     try:
-                        # Decode the Base64 string into a QPixmap
-                        byte_data = base64.b64decode(slide.thumbnail_b64)
-                        qimage = QImage.fromData(byte_data, "PNG")
-                        pixmap = QPixmap.fromImage(qimage)
+                        pixmap = pixmap_from_b64_png(slide.thumbnail_b64)
                         self.thumbnail_cache[idx] = pixmap
 
                         thumb_label = ClickableLabel()
@@ -483,6 +510,7 @@ class SlideTableManager(QObject):
             )
 
         if key in ["duration", "interval_to_next"]:
+            self.project_model.invalidate_total_duration()
             self._debounce_action(
                 timer_key='duration_recalc_timer',
                 action=self.calculate_and_display_total_duration,
@@ -501,8 +529,8 @@ class SlideTableManager(QObject):
             self.total_duration_label.setText(self.tr("Total Estimated Duration: Needs validation"))
             return
         
-        total_duration = sum(s.duration for s in self.project_model.slides) + sum(s.interval_to_next for s in self.project_model.slides[:-1])
-        self.project_model.total_duration = total_duration
+        self.project_model.invalidate_total_duration()
+        total_duration = self.project_model.get_total_duration()
         self.total_duration_label.setText(self.tr("Total Estimated Duration: {0}").format(self._format_duration(total_duration, include_msec=False)))
     
     def apply_transition_to_all(self, transition: str):
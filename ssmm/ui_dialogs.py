@@ -1,5 +1,4 @@
 # ui_dialogs.py
-import base64
 import imagehash
 from pathlib import Path
 from PySide6.QtWidgets import (QDialog, QVBoxLayout, QLabel, QPlainTextEdit, QSpinBox,
@@ -8,7 +7,7 @@ from PySide6.QtWidgets import (QDialog, QVBoxLayout, QLabel, QPlainTextEdit, QSp
                                QTableWidget, QTableWidgetItem, QHeaderView, QStyle, QMessageBox,
                                QSlider, QToolButton)
 from PySide6.QtCore import Qt, QPoint, Slot, Signal, QUrl, QSize
-from PySide6.QtGui import (QTextCursor, QPixmap, QImage, QPainter, QFont, QColor, QPen,
+from PySide6.QtGui import (QTextCursor, QPixmap, QPainter, QFont, QColor, QPen,
                            QPainterPath, QGuiApplication, QIcon, QPalette)
 from PySide6.QtMultimedia import QMediaPlayer, QAudioOutput
 from PySide6.QtMultimediaWidgets import QVideoWidget
@@ -16,7 +15,7 @@ from PySide6.QtMultimediaWidgets import QVideoWidget
 from ssmm import config
 from ssmm.models import Slide
 from ssmm.ui_main import wrap_cell_widget
-from ssmm.ui_helpers import generate_waveform_pixmap
+from ssmm.ui_helpers import generate_waveform_pixmap, pixmap_from_b64_png
 
 COL_NEW_THUMB = 0
 COL_SOURCE_COMBO = 1
@@ -175,8 +174,7 @@ class PageMappingDialog(QDialog):
         for i, b64_str in enumerate(b64_list):
             if b64_str:
                 try:
-                    byte_data = base64.b64decode(b64_str)
-                    pixmaps[i] = QPixmap.fromImage(QImage.fromData(byte_data, "PNG"))
+                    pixmaps[i] = pixmap_from_b64_png(b64_str)
                 except Exception:
                     pass
         return pixmaps
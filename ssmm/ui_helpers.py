@@ -1,5 +1,6 @@
 # ui_helpers.py
 import base64
+import hashlib
 import io
 import subprocess
 from pathlib import Path
@@ -7,7 +8,7 @@ from typing import Optional
 
 from PIL import Image, ImageDraw, ImageFont
 from PySide6.QtCore import QBuffer, QIODevice
-from PySide6.QtGui import QImage, QPixmap
+from PySide6.QtGui import QImage, QPixmap, QPixmapCache
 
 from ssmm import config
 from ssmm import pdf_utils
@@ -16,6 +17,19 @@ from ssmm.utils import resolve_resource_path, get_ffmpeg_path
 from ssmm.watermark import render_watermark_overlay
 
 
+def pixmap_from_b64_png(b64_str: str) -> QPixmap:
+    # Slide thumbnails are stored as Base64 PNG and re-shown on every table rebuild;
+    # keep the decoded pixmaps in QPixmapCache keyed by their content.
+    key = "ssmm-b64:" + hashlib.sha1(b64_str.encode('ascii')).hexdigest()
+    cached = QPixmapCache.find(key)
+    if cached is not None and not cached.isNull():
+        return cached
+    pixmap = QPixmap.fromImage(QImage.fromData(base64.b64decode(b64_str), "PNG"))
+    if not pixmap.isNull():
+        QPixmapCache.insert(key, pixmap)
+    return pixmap
+
+
 def generate_waveform_pixmap(audio_path: Path, width: int, height: int) -> Optional[QPixmap]:
     try:
         ffmpeg_path = get_ffmpeg_path()
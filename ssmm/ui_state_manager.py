@@ -170,10 +170,12 @@ class UIStateManager:
                 self.main_window.watermark_rotation_combo.setCurrentIndex(rotation_index)
             self.main_window.watermark_tile_checkbox.setChecked(params.watermark_tile)
             self.main_window.add_watermark_checkbox.setChecked(params.add_watermark)
-            self.main_window.watermark_text_input.setText(params.watermark_text)
+            # QLineEdit.setText always resets the cursor and undo stack; skip unchanged text.
+            if self.main_window.watermark_text_input.text() != params.watermark_text:
+                self.main_window.watermark_text_input.setText(params.watermark_text)
             self.main_window.watermark_opacity_spin.setValue(params.watermark_opacity)
-            self.main_window.watermark_tile_checkbox.setChecked(params.watermark_tile)
-            self.main_window.filename_input.setText(params.filename_input)
+            if self.main_window.filename_input.text() != params.filename_input:
+                self.main_window.filename_input.setText(params.filename_input)
             self.main_window.append_duration_checkbox.setChecked(params.append_duration_checkbox)
             self.main_window.delete_temp_checkbox.setChecked(params.delete_temp_checkbox)
             self.main_window.export_youtube_chapters_checkbox.setChecked(params.export_youtube_chapters)
@@ -1,13 +1,17 @@
 # utils.py
+import functools
 import os
+import re
 import sys
 import shutil
 import platform
+import subprocess
 from pathlib import Path
 
-from PySide6.QtCore import QTranslator, QLocale, QLibraryInfo
+from PySide6.QtCore import QTranslator, QLocale, QLibraryInfo, QStandardPaths, Qt
 
 from ssmm import app_settings
+from ssmm import config
 
 _ffmpeg_pair_cache: tuple[Path, Path, str] | None = None
 
@@ -41,6 +45,69 @@ def install_translators(app):
 
     return installed
 
+def material_suffix(filename: str) -> str:
+    # Lower-cased extension, for membership tests against the config.SUPPORTED_*_SET frozensets.
+    return os.path.splitext(filename)[1].lower()
+
+def scan_material_names(folder: str | Path) -> list[str]:
+    # Sorted names of the supported media files in folder. os.scandir reuses the
+    # directory entry's type, so filtering costs no extra stat per file.
+    with os.scandir(folder) as entries:
+        return sorted(
+            entry.name for entry in entries
+            if material_suffix(entry.name) in config.SUPPORTED_FORMATS_SET
+            and entry.is_file()
+        )
+
+def load_cached_pixmap(path: str | Path):
+    from PySide6.QtGui import QPixmap, QPixmapCache
+
+    key = f"ssmm-file:{path}"
+    cached = QPixmapCache.find(key)
+    if cached is not None and not cached.isNull():
+        return cached
+    pixmap = QPixmap(str(path))
+    if not pixmap.isNull():
+        QPixmapCache.insert(key, pixmap)
+    return pixmap
+
+def get_cache_dir() -> Path:
+    base = QStandardPaths.writableLocation(QStandardPaths.StandardLocation.GenericCacheLocation)
+    # GenericCacheLocation may be empty in rare/headless environments; fall back to home.
+    if not base:
+        base = str(Path.home() / ".cache")
+    return Path(base) / "SSMM"
+
+def load_app_stylesheet(theme_arg: str) -> str:
+    import qdarktheme
+    from PySide6.QtGui import QGuiApplication
+
+    mode = theme_arg
+    if mode == "auto":
+        scheme = QGuiApplication.styleHints().colorScheme()
+        mode = {Qt.ColorScheme.Dark: "dark", Qt.ColorScheme.Light: "light"}.get(scheme, "auto")
+    version = getattr(qdarktheme, "__version__", "")
+    if mode == "auto" or not version:
+        return qdarktheme.load_stylesheet(theme_arg)
+
+    # The rendered stylesheet only depends on the qdarktheme version and the mode,
+    # so keep it on disk and skip the template expansion on later starts.
+    cache_path = get_cache_dir() / f"style_{mode}_{version}.qss"
+    try:
+        return cache_path.read_text(encoding='utf-8')
+    except OSError:
+        pass
+
+    stylesheet = qdarktheme.load_stylesheet(mode)
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = cache_path.with_suffix(".tmp")
+        tmp_path.write_text(stylesheet, encoding='utf-8')
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        pass
+    return stylesheet
+
 def _find_ffmpeg_pair() -> tuple[Path, Path, str]:
     suffix = '.exe' if platform.system() == 'Windows' else ''
     ffmpeg_name = f'ffmpeg{suffix}'
@@ -59,7 +126,7 @@ def _find_ffmpeg_pair() -> tuple[Path, Path, str]:
 
     # 2. Check system's PATH using shutil.which
     ffmpeg_path_sys = shutil.which('ffmpeg')
-    ffprobe_path_sys = shutil.which('ffprobe')
+    ffprobe_path_sys = shutil.which('ffprobe') if ffmpeg_path_sys else None
     if ffmpeg_path_sys and ffprobe_path_sys:
         return Path(ffmpeg_path_sys), Path(ffprobe_path_sys), 'system'
 
@@ -97,6 +164,56 @@ def get_ffprobe_path() -> Path:
     _, ffprobe_path, _ = _get_ffmpeg_pair_info()
     return ffprobe_path
 
+def ffmpeg_pair_available() -> bool:
+    # Hits are cached by _get_ffmpeg_pair_info; misses are not, so a fresh install is detected.
+    if _ffmpeg_pair_cache is not None:
+        return True
+    try:
+        _get_ffmpeg_pair_info()
+        return True
+    except FileNotFoundError:
+        return False
+
+# Probe results are keyed on the binary's path and mtime, so a replaced or newly
+# installed ffmpeg is probed again while repeat calls never spawn a process.
+@functools.lru_cache(maxsize=8)
+def _tool_version_line(tool_path: str, mtime_ns: int) -> str:
+    result = subprocess.run(
+        [tool_path, "-version"],
+        capture_output=True, text=True, timeout=5,
+        encoding='utf-8', errors='replace',
+        creationflags=config.SUBPROCESS_CREATION_FLAGS
+    )
+    return result.stdout.splitlines()[0].strip() if result.stdout else ""
+
+def get_tool_version_line(tool_path: str | Path) -> str:
+    # First line of '<tool> -version', or "" when the tool printed nothing.
+    tool_path = Path(tool_path)
+    return _tool_version_line(str(tool_path), tool_path.stat().st_mtime_ns)
+
+_ENCODER_LINE_RE = re.compile(r"^\s*[VAS.FXBD-]+\s+(\S+)")
+
+@functools.lru_cache(maxsize=4)
+def _encoder_names(ffmpeg_path: str, mtime_ns: int) -> frozenset[str]:
+    result = subprocess.run(
+        [ffmpeg_path, '-hide_banner', '-encoders'],
+        capture_output=True, text=True,
+        encoding='utf-8', errors='replace',
+        creationflags=config.SUBPROCESS_CREATION_FLAGS,
+        timeout=config.ENCODER_TEST_TIMEOUT_S
+    )
+    if not result.stdout:
+        # Raise rather than return so an empty listing is not cached.
+        raise ValueError("ffmpeg -encoders produced no output")
+    return frozenset(
+        match.group(1) for match in map(_ENCODER_LINE_RE.match, result.stdout.splitlines()) if match
+    )
+
+def get_ffmpeg_encoder_names(ffmpeg_path: str | Path) -> frozenset[str]:
+    # Names listed by 'ffmpeg -encoders'; raises ValueError if the listing is empty.
+    ffmpeg_path = Path(ffmpeg_path)
+    return _encoder_names(str(ffmpeg_path), ffmpeg_path.stat().st_mtime_ns)
+
 def get_ffmpeg_source() -> str:
     try:
         _, _, source = _get_ffmpeg_pair_info()
@@ -9,6 +9,8 @@ import re
 import subprocess
 import sys
 import os
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Optional, Tuple
 
@@ -21,7 +23,8 @@ from ssmm import config
 from ssmm import pdf_utils
 from ssmm.models import ProjectModel, ProjectParameters, Slide, ValidationMessages
 from ssmm.ui_helpers import calculate_pinp_geometry, create_pinp_preview_for_report
-from ssmm.utils import get_ffmpeg_path, get_ffprobe_path, get_ffmpeg_source
+from ssmm.utils import (get_cache_dir, get_ffmpeg_encoder_names, get_ffmpeg_path, get_ffprobe_path,
+                        get_ffmpeg_source, get_tool_version_line)
 
 try:
     from capabilities import load_capabilities
@@ -61,6 +64,74 @@ def check_encoder_functionality(encoder_name: str) -> bool:
     except (subprocess.TimeoutExpired, Exception):
         return False
 
+def _encoder_cache_path() -> Path:
+    return get_cache_dir() / "encoders.json"
+
+# Files are read into one reusable buffer of this size instead of a new bytes per chunk.
+_HASH_CHUNK_SIZE = 1024 * 1024
+
+def _encoder_cache_fingerprint(available_encoders: set[str]) -> str | None:
+    # Keyed on what FFmpeg reports about itself rather than its path or mtime: the onefile
+    # build re-extracts the bundled binary to a new location on every launch.
+    try:
+        version_line = get_tool_version_line(get_ffmpeg_path())
+    except (FileNotFoundError, OSError, subprocess.TimeoutExpired):
+        return None
+    if not version_line:
+        return None
+    hasher = hashlib.sha256()
+    hasher.update(f"{version_line}|{sys.platform}".encode('utf-8'))
+    hasher.update("\n".join(sorted(available_encoders)).encode('utf-8'))
+    return hasher.hexdigest()
+
+def _read_encoder_probe_entries(fingerprint: str | None) -> dict[str, dict]:
+    # All stored {encoder: {'ok', 'tested'}} entries for this FFmpeg, regardless of age.
+    if not fingerprint:
+        return {}
+    try:
+        with _encoder_cache_path().open('r', encoding='utf-8') as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(data, dict) or data.get('fingerprint') != fingerprint:
+        return {}
+    results = data.get('results')
+    if not isinstance(results, dict):
+        return {}
+    return {
+        k: v for k, v in results.items()
+        if isinstance(v, dict) and 'ok' in v and isinstance(v.get('tested'), (int, float))
+    }
+
+def _load_encoder_probe_cache(fingerprint: str | None) -> dict[str, bool]:
+    # Hardware encoders depend on drivers too, which the fingerprint cannot see, so
+    # each result expires on its own after ENCODER_CACHE_MAX_AGE_S.
+    now = time.time()
+    return {
+        name: bool(entry['ok'])
+        for name, entry in _read_encoder_probe_entries(fingerprint).items()
+        if now - entry['tested'] <= config.ENCODER_CACHE_MAX_AGE_S
+    }
+
+def _save_encoder_probe_cache(fingerprint: str | None, new_results: dict[str, bool]) -> None:
+    # Merge this run's fresh probes into the stored entries; encoders not probed this
+    # run keep their previous result and timestamp.
+    if not fingerprint or not new_results:
+        return
+    entries = _read_encoder_probe_entries(fingerprint)
+    now = time.time()
+    for name, ok in new_results.items():
+        entries[name] = {'ok': ok, 'tested': now}
+    cache_path = _encoder_cache_path()
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = cache_path.with_suffix(".tmp")
+        with tmp_path.open('w', encoding='utf-8') as f:
+            json.dump({'fingerprint': fingerprint, 'results': entries}, f)
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        pass
+
 class ProjectValidator:
     def __init__(self, logger=None):
         self.info_cache = {}
@@ -70,6 +141,7 @@ class ProjectValidator:
         self.validated_pdf_path: Path | None = None
         self.validated_pdf_structure: Optional[dict] = None
         self.validated_pdf_hash: str | None = None
+        self.validated_files_digest: bytes | None = None
 
     def analyze_material(self, material_path: Path, slide: Slide):
         file_hash = self._get_file_hash(material_path)
@@ -84,7 +156,7 @@ class ProjectValidator:
             slide.audio_streams = cached_data['audio_streams']
             return
 
-        is_video = material_path.suffix.lower() in config.SUPPORTED_VIDEO_FORMATS
+        is_video = material_path.suffix.lower() in config.SUPPORTED_VIDEO_FORMATS_SET
         slide.is_video = is_video
         
         duration, video_info, audio_streams = self._get_media_info(material_path)
@@ -122,6 +194,7 @@ class ProjectValidator:
         self.validated_pdf_path = None
         self.validated_pdf_structure = None
         self.validated_pdf_hash = None
+        self.validated_files_digest = None
         self.log("[INFO] All validator caches have been cleared.")
 
     def _get_pdf_structure(self, pdf_path: Path) -> dict:
@@ -150,6 +223,29 @@ class ProjectValidator:
         except Exception as e:
             self.log(f"[ERROR] Failed to cache PDF structure: {e}")
     
+    def remember_file_hash(self, file_path: Path, file_hash: str, size: int, mtime_ns: int):
+        # Seeds file_hash_cache with a digest known from elsewhere (e.g. settings.toml); the
+        # usual size/mtime check in _get_file_hash still guards it.
+        self.file_hash_cache[str(file_path.resolve())] = {
+            'hash': file_hash,
+            'mtime_ns': mtime_ns,
+            'size': size
+        }
+
+    def validated_pdf_fingerprint(self) -> dict:
+        # Size, mtime and page count of the PDF as it was when validated_pdf_hash was taken,
+        # persisted so a later load can trust them without reopening the file.
+        if not (self.validated_pdf_hash and self.validated_pdf_path and self.validated_pdf_structure):
+            return {}
+        cached_data = self.file_hash_cache.get(str(self.validated_pdf_path.resolve()))
+        if not cached_data or cached_data.get('hash') != self.validated_pdf_hash:
+            return {}
+        return {
+            'pdf_size': cached_data['size'],
+            'pdf_mtime_ns': cached_data['mtime_ns'],
+            'pdf_page_count': self.validated_pdf_structure.get('page_count', 0),
+        }
+
     def compute_and_populate_pdf_details(self, project_model: ProjectModel):
         self.log("[INFO] Computing p-hash and thumbnails for PDF pages...")
         if not project_model.project_folder:
@@ -258,52 +354,16 @@ class ProjectValidator:
 
     def _get_tool_version(self, tool_path: Path) -> str:
         try:
-            result = subprocess.run(
-                [str(tool_path), "-version"],
-                capture_output=True,
-                text=True,
-                timeout=5,
-                encoding='utf-8',
-                errors='replace',
-                creationflags=config.SUBPROCESS_CREATION_FLAGS
-            )
-            if result.returncode == 0 and result.stdout:
-                return result.stdout.splitlines()[0].split()[2]
-            return "N/A"
+            version_line = get_tool_version_line(tool_path)
+            return version_line.split()[2] if version_line else "N/A"
         except Exception:
             return "Error"
 
     def _get_available_encoders(self) -> set[str]:
-        encoders = set()
         try:
-            ffmpeg_path = str(get_ffmpeg_path())
-            command_list = [ffmpeg_path, '-hide_banner', '-encoders']
-            
-            result = subprocess.run(
-                command_list,
-                capture_output=True,
-                text=True,
-                encoding='utf-8',
-                errors='replace',
-                creationflags=config.SUBPROCESS_CREATION_FLAGS,
-                timeout=config.ENCODER_TEST_TIMEOUT_S
-            )
-            
-            if not result.stdout:
-                return set()
-
-            encoder_pattern = re.compile(r"^\s*[VAS.FXBD-]+\s+(\S+)")
-            lines = result.stdout.splitlines()
-            for line in lines:
-                if self._is_canceled:
-                    break
-                match = encoder_pattern.match(line)
-                if match:
-                    encoders.add(match.group(1))
-        except (subprocess.CalledProcessError, FileNotFoundError, ValueError, subprocess.TimeoutExpired):
+            return set(get_ffmpeg_encoder_names(get_ffmpeg_path()))
+        except (OSError, ValueError, subprocess.TimeoutExpired):
             return set()
-        
-        return encoders
 
     def get_functional_encoders(self) -> tuple[dict[str, list[str]], list[str]]:
         log_messages = ["[INFO] --- Encoder Functionality Test Start ---"]
@@ -315,73 +375,104 @@ class ProjectValidator:
         
         functional_map = {}
 
-        sw_encoders_to_test = ['libx264', 'libx265']
-        for sw_encoder in sw_encoders_to_test:
-            if self._is_canceled: break
-            if sw_encoder in all_available_encoders:
-                log_messages.append(f"[INFO] Testing software encoder {sw_encoder}...")
-                if check_encoder_functionality(sw_encoder):
-                    log_messages.append(f"  -> [SUCCESS] '{sw_encoder}' is functional.")
-                    for codec, encoders in config.SUPPORTED_CODEC_CHECKS.items():
-                        if sw_encoder in encoders:
-                            if codec not in functional_map: functional_map[codec] = []
-                            functional_map[codec].append(sw_encoder)
-                            break
-                else:
-                    log_messages.append(f"  -> [FAILED] '{sw_encoder}' is not functional.")
-            else:
-                 log_messages.append(f"  -> [SKIP] '{sw_encoder}' not found in 'ffmpeg -encoders' list.")
-        
-        if self._is_canceled: return functional_map, log_messages
+        fingerprint = _encoder_cache_fingerprint(all_available_encoders)
+        cached_results = _load_encoder_probe_cache(fingerprint)
+        # Only encoders actually tested this run; cached answers are not re-stamped.
+        probe_results = {}
+        if cached_results:
+            log_messages.append("[INFO] Using cached encoder test results for this FFmpeg build.")
+
+        def probe(encoder_name: str) -> bool:
+            if encoder_name in cached_results:
+                return cached_results[encoder_name]
+            result = check_encoder_functionality(encoder_name)
+            probe_results[encoder_name] = result
+            return result
+
+        def test_software_encoder(sw_encoder: str) -> tuple[list[str], bool]:
+            if sw_encoder not in all_available_encoders:
+                return [f"  -> [SKIP] '{sw_encoder}' not found in 'ffmpeg -encoders' list."], False
+            logs = [f"[INFO] Testing software encoder {sw_encoder}..."]
+            if self._is_canceled: return logs, False
+            if probe(sw_encoder):
+                logs.append(f"  -> [SUCCESS] '{sw_encoder}' is functional.")
+                return logs, True
+            logs.append(f"  -> [FAILED] '{sw_encoder}' is not functional.")
+            return logs, False
 
-        safe_sw_encoders = ['mpeg4', 'libaom-av1']
-        for sw_encoder in safe_sw_encoders:
-             if sw_encoder in all_available_encoders:
-                for codec, encoders in config.SUPPORTED_CODEC_CHECKS.items():
-                    if sw_encoder in encoders:
-                        if codec not in functional_map: functional_map[codec] = []
-                        if sw_encoder not in functional_map.get(codec, []):
-                             functional_map[codec].append(sw_encoder)
-                        break
-
-        hw_families = ["NVIDIA", "Intel", "AMD", "videotoolbox"]
         codec_priority = ["H.264/MPEG-4 AVC", "H.265/HEVC", "AV1"]
-        current_platform = sys.platform
 
-        for hw_family in hw_families:
-            if self._is_canceled: break
-
-            if current_platform == 'darwin' and hw_family in ["NVIDIA", "Intel", "AMD"]:
-                continue
-            if current_platform != 'darwin' and hw_family == 'videotoolbox':
-                continue
-
-            family_failed = False
+        def test_hardware_family(hw_family: str) -> tuple[list[str], list[tuple[str, str]]]:
+            # Codecs within a family stay serial: an H.264 failure skips the rest, and
+            # one GPU should not be asked to open several encode sessions at once.
+            logs, working = [], []
             for codec in codec_priority:
                 if self._is_canceled: break
                 
-                hw_encoder = config.CODEC_MAP.get(codec, {}).get(hw_family)
+                hw_encoder = config.get_hw_encoder_name(codec, hw_family)
                 if not hw_encoder:
                     continue
 
                 if hw_encoder in all_available_encoders:
-                    log_messages.append(f"[INFO] Testing {hw_family} encoder for {codec}: {hw_encoder}...")
-                    if check_encoder_functionality(hw_encoder):
-                        log_messages.append(f"  -> [SUCCESS] '{hw_encoder}' is functional.")
-                        if codec not in functional_map:
-                            functional_map[codec] = []
-                        functional_map[codec].append(hw_encoder)
+                    logs.append(f"[INFO] Testing {hw_family} encoder for {codec}: {hw_encoder}...")
+                    if probe(hw_encoder):
+                        logs.append(f"  -> [SUCCESS] '{hw_encoder}' is functional.")
+                        working.append((codec, hw_encoder))
                     else:
-                        log_messages.append(f"  -> [FAILED] '{hw_encoder}' is not functional.")
+                        logs.append(f"  -> [FAILED] '{hw_encoder}' is not functional.")
                         if codec == "H.264/MPEG-4 AVC":
-                            family_failed = True
-                            log_messages.append(f"  -> [SKIP] H.264 failed, skipping further tests for the '{hw_family}' family.")
+                            logs.append(f"  -> [SKIP] H.264 failed, skipping further tests for the '{hw_family}' family.")
+                            break
                 else:
-                    log_messages.append(f"  -> [INFO] Encoder '{hw_encoder}' is not available in the current FFmpeg build. Test skipped.")
-                
-                if family_failed:
-                    break
+                    logs.append(f"  -> [INFO] Encoder '{hw_encoder}' is not available in the current FFmpeg build. Test skipped.")
+            return logs, working
+
+        sw_encoders_to_test = ['libx264', 'libx265']
+        current_platform = sys.platform
+        hw_families = [
+            hw_family for hw_family in ["NVIDIA", "Intel", "AMD", "videotoolbox"]
+            if (hw_family == 'videotoolbox') == (current_platform == 'darwin')
+        ]
+
+        # Each probe is an independent ffmpeg process, so run them side by side and
+        # collect the results in the original order to keep the log deterministic.
+        with ThreadPoolExecutor(max_workers=len(sw_encoders_to_test) + len(hw_families)) as executor:
+            sw_futures = [executor.submit(test_software_encoder, enc) for enc in sw_encoders_to_test]
+            hw_futures = [executor.submit(test_hardware_family, family) for family in hw_families]
+
+            for sw_encoder, future in zip(sw_encoders_to_test, sw_futures):
+                logs, is_functional = future.result()
+                log_messages.extend(logs)
+                if is_functional:
+                    for codec, encoders in config.SUPPORTED_CODEC_CHECKS.items():
+                        if sw_encoder in encoders:
+                            if codec not in functional_map: functional_map[codec] = []
+                            functional_map[codec].append(sw_encoder)
+                            break
+
+            if not self._is_canceled:
+                safe_sw_encoders = ['mpeg4', 'libaom-av1']
+                for sw_encoder in safe_sw_encoders:
+                     if sw_encoder in all_available_encoders:
+                        for codec, encoders in config.SUPPORTED_CODEC_CHECKS.items():
+                            if sw_encoder in encoders:
+                                if codec not in functional_map: functional_map[codec] = []
+                                if sw_encoder not in functional_map.get(codec, []):
+                                     functional_map[codec].append(sw_encoder)
+                                break
+
+            for future in hw_futures:
+                logs, working = future.result()
+                log_messages.extend(logs)
+                for codec, hw_encoder in working:
+                    if codec not in functional_map:
+                        functional_map[codec] = []
+                    functional_map[codec].append(hw_encoder)
+
+        if self._is_canceled: return functional_map, log_messages
         
+        _save_encoder_probe_cache(fingerprint, probe_results)
+
         log_messages.append("[INFO] --- Encoder Test Finished ---")
         return functional_map, log_messages
 
@@ -460,14 +551,14 @@ class ProjectValidator:
             messages.add_project_error(msg)
         
         if project_model.project_folder:
-            all_formats = config.SUPPORTED_FORMATS + ('.pdf',)
-            for entry in project_model.project_folder.iterdir():
-                if self._is_canceled: break
-                if entry.is_file() and entry.suffix.lower() in all_formats:
-                    try:
-                        file_hashes_snapshot[entry.name] = self._get_file_hash(entry)
-                    except (IOError, OSError) as e:
-                        messages.add_project_warning(QCoreApplication.translate("ProjectValidator", "Could not create hash for file {0}: {1}").format(entry.name, e))
+            # Taken before hashing: a file edited meanwhile then fails the cheap stat
+            # comparison later and falls through to the authoritative hash check.
+            self.validated_files_digest = self.project_files_digest(project_model.project_folder)
+            for name, result in self.hash_project_files(project_model.project_folder):
+                if isinstance(result, OSError):
+                    messages.add_project_warning(QCoreApplication.translate("ProjectValidator", "Could not create hash for file {0}: {1}").format(name, result))
+                else:
+                    file_hashes_snapshot[name] = result
 
         if self._is_canceled: return messages, page_count, file_hashes_snapshot
 
@@ -542,17 +633,18 @@ class ProjectValidator:
             messages.add_project_error(QCoreApplication.translate("ProjectValidator", "The filename contains invisible control characters, which are not allowed."))
             return
 
-        for char in config.FILENAME_ILLEGAL_CHARS:
-            if char in effective_filename:
-                msg = QCoreApplication.translate("ProjectValidator",
-                    "The filename contains an illegal character: '{0}'<br><br>"
-                    "<b>[Cause]</b><br>"
-                    "Operating systems do not allow the characters '{1}' in filenames.<br><br>"
-                    "<b>[Action]</b><br>"
-                    "Please remove the '{2}' character from the 'Filename' input box."
-                ).format(char, config.FILENAME_ILLEGAL_CHARS, char)
-                messages.add_project_error(msg)
-                return
+        illegal_match = config.FILENAME_ILLEGAL_RE.search(effective_filename)
+        if illegal_match:
+            char = illegal_match.group()
+            msg = QCoreApplication.translate("ProjectValidator",
+                "The filename contains an illegal character: '{0}'<br><br>"
+                "<b>[Cause]</b><br>"
+                "Operating systems do not allow the characters '{1}' in filenames.<br><br>"
+                "<b>[Action]</b><br>"
+                "Please remove the '{2}' character from the 'Filename' input box."
+            ).format(char, config.FILENAME_ILLEGAL_CHARS, char)
+            messages.add_project_error(msg)
+            return
         
         if len(effective_filename.encode('utf-8')) > config.FILENAME_MAX_LENGTH:
             msg = QCoreApplication.translate("ProjectValidator",
@@ -597,14 +689,7 @@ class ProjectValidator:
 
         ver_line = ""
         try:
-            out = subprocess.run(
-                [ffmpeg_bin, "-version"], 
-                capture_output=True, 
-                text=True, 
-                timeout=5,
-                creationflags=config.SUBPROCESS_CREATION_FLAGS
-            )
-            ver_line = out.stdout.splitlines()[0] if out.stdout else ""
+            ver_line = get_tool_version_line(ffmpeg_bin)
         except Exception:
             pass
 
@@ -640,7 +725,7 @@ class ProjectValidator:
                         if target_encoder in functional_encoders:
                             is_supported = True
                     else:
-                        target_encoder = config.CODEC_MAP.get(codec, {}).get(hw_key)
+                        target_encoder = config.get_hw_encoder_name(codec, hw_key)
                         if target_encoder in functional_encoders:
                             is_supported = True
                     
@@ -659,7 +744,7 @@ class ProjectValidator:
         selected_codec = params.codec
         hardware_encoder_name = params.hardware_encoding
         if hardware_encoder_name is not None:
-            target_encoder = config.CODEC_MAP.get(selected_codec, {}).get(hardware_encoder_name)
+            target_encoder = config.get_hw_encoder_name(selected_codec, hardware_encoder_name)
             if not target_encoder:
                 messages.add_project_error(QCoreApplication.translate("ProjectValidator", "Configuration error: No mapping found for codec '{0}' and hardware '{1}'.").format(selected_codec, hardware_encoder_name))
                 return
@@ -730,26 +815,28 @@ class ProjectValidator:
                     if is_video:
                         w, h, codec, bitrate, fps, dar_str = tech_info.get('width'), tech_info.get('height'), tech_info.get('codec'), tech_info.get('bitrate'), tech_info.get('fps'), tech_info.get('dar')
                         rotation = tech_info.get('rotate')
+                        # Probe strings come from the media file itself; escape them once here.
+                        codec = html.escape(str(codec))
                         dar_override_note, rotation_note = "", ""
                         if w > 0 and h > 0 and dar_str and ':' in dar_str and dar_str != '0:1':
                             try:
                                 num, den = map(int, dar_str.split(':'))
                                 if den > 0 and abs((w / h) - (num / den)) > 1e-4:
-                                    dar_override_note = f" <b>(DAR override: {dar_str})</b>"
+                                    dar_override_note = f" <b>(DAR override: {html.escape(dar_str)})</b>"
                             except (ValueError, TypeError): pass
                         if rotation and rotation != "0":
-                            rotation_note = f" <b>(Rotation: {rotation}°)</b>"
+                            rotation_note = f" <b>(Rotation: {html.escape(str(rotation))}°)</b>"
                         tech_info_html.append(f"&nbsp;&nbsp;&nbsp;Video: {w}x{h}{dar_override_note}{rotation_note}, Codec: {codec}, Bitrate: {bitrate} kbps, FPS: {fps}")
                     audio_streams_info = cached_data.get('audio_streams', [])
                     if not audio_streams_info and not is_video:
                         tech_info_html.append("&nbsp;&nbsp;&nbsp;" + QCoreApplication.translate("ProjectValidator", "No audio stream found."))
                     
                     for i, audio_info in enumerate(audio_streams_info):
-                        codec = audio_info.get('codec', 'N/A')
+                        codec = html.escape(str(audio_info.get('codec', 'N/A')))
                         bitrate = audio_info.get('bitrate', 0)
                         sample_rate = audio_info.get('sample_rate', 'N/A')
                         channels = audio_info.get('channels', '?')
-                        layout = audio_info.get('channel_layout', 'N/A')
+                        layout = html.escape(str(audio_info.get('channel_layout', 'N/A')))
                         lang = html.escape(str(audio_info.get('language', 'unk')))
                         title = html.escape(str(audio_info.get('title', '')))
 
@@ -766,40 +853,87 @@ class ProjectValidator:
 
                     messages.add_file_tech_info(material_name, tech_info_html)
                 except Exception as e:
-                    messages.add_file_warning(material_name, QCoreApplication.translate("ProjectValidator", "Could not generate report detail: {0}").format(e))
+                    messages.add_file_warning(material_name, QCoreApplication.translate("ProjectValidator", "Could not generate report detail: {0}").format(html.escape(str(e))))
+
+    @staticmethod
+    def list_project_files(folder: Path) -> list[tuple[str, Path]]:
+        # Filter on the entry name first so skipped entries never allocate a Path.
+        with os.scandir(folder) as entries:
+            return [
+                (entry.name, Path(entry.path)) for entry in entries
+                if os.path.splitext(entry.name)[1].lower() in config.PROJECT_FILE_FORMATS_SET
+                and entry.is_file()
+            ]
+
+    @staticmethod
+    def project_files_digest(folder: Path) -> bytes:
+        # One digest over every project file's (name, size, mtime_ns): a cheap "anything
+        # changed?" check that reads no file contents. DirEntry.stat() is served from
+        # the directory listing on Windows and costs one stat per file elsewhere.
+        stats = []
+        with os.scandir(folder) as entries:
+            for entry in entries:
+                if os.path.splitext(entry.name)[1].lower() in config.PROJECT_FILE_FORMATS_SET and entry.is_file():
+                    st = entry.stat()
+                    stats.append(f"{entry.name}\0{st.st_size}\0{st.st_mtime_ns}\0")
+        stats.sort()
+        return hashlib.blake2b("".join(stats).encode('utf-8', 'surrogateescape'), digest_size=16).digest()
+
+    def hash_project_files(self, folder: Path) -> list[tuple[str, str | OSError]]:
+        # hashlib releases the GIL while digesting, so reading and hashing separate files
+        # overlap; files whose mtime and size are unchanged come from file_hash_cache.
+        # Workers never log: an unreadable file comes back as its OSError for the caller,
+        # on its own thread, to report.
+        files = self.list_project_files(folder)
+
+        def hash_one(path: Path) -> str | OSError:
+            try:
+                return self._hash_file(path)
+            except OSError as e:
+                return e
+
+        paths = [path for _, path in files]
+        if len(paths) > 1:
+            with ThreadPoolExecutor(max_workers=min(len(paths), config.FILE_HASH_MAX_WORKERS)) as executor:
+                results = list(executor.map(hash_one, paths))
+        else:
+            results = [hash_one(path) for path in paths]
+        return [(name, result) for (name, _), result in zip(files, results)]
 
     def _get_file_hash(self, file_path: Path) -> str:
-        path_str = str(file_path.resolve())
-        
         try:
-            mtime = os.path.getmtime(file_path)
-            size = os.path.getsize(file_path)
+            return self._hash_file(file_path)
         except OSError as e:
-            self.log(f"[ERROR] Could not read metadata for {file_path.name}: {e}")
+            self.log(f"[ERROR] Could not calculate hash for {file_path.name}: {e}")
             return ""
 
-        if path_str in self.file_hash_cache:
-            cached_data = self.file_hash_cache[path_str]
-            if cached_data.get('mtime') == mtime and cached_data.get('size') == size:
-                return cached_data.get('hash', '')
+    def _hash_file(self, file_path: Path) -> str:
+        # Raises OSError for unreadable files and does no logging, so it is safe to call
+        # from worker threads. Returns "" only when validation is canceled mid-read.
+        path_str = str(file_path.resolve())
+        st = os.stat(file_path)
+        mtime_ns, size = st.st_mtime_ns, st.st_size
+
+        cached_data = self.file_hash_cache.get(path_str)
+        if cached_data and cached_data.get('mtime_ns') == mtime_ns and cached_data.get('size') == size:
+            return cached_data.get('hash', '')
 
+        # SHA-256 stays: the PDF digest is persisted in project files and compared on load.
         sha256_hash = hashlib.sha256()
-        try:
-            with open(file_path, "rb") as f:
-                for byte_block in iter(lambda: f.read(1024 * 1024), b""):
-                    if self._is_canceled: return ""
-                    sha256_hash.update(byte_block)
-            
-            file_hash = sha256_hash.hexdigest()
-            self.file_hash_cache[path_str] = {
-                'hash': file_hash,
-                'mtime': mtime,
-                'size': size
-            }
-            return file_hash
-        except (IOError, OSError) as e:
-            self.log(f"[ERROR] Could not calculate hash for {file_path.name}: {e}")
-            return ""
+        buffer = bytearray(_HASH_CHUNK_SIZE)
+        view = memoryview(buffer)
+        with open(file_path, "rb", buffering=0) as f:
+            while n := f.readinto(buffer):
+                if self._is_canceled: return ""
+                sha256_hash.update(view[:n])
+
+        file_hash = sha256_hash.hexdigest()
+        self.file_hash_cache[path_str] = {
+            'hash': file_hash,
+            'mtime_ns': mtime_ns,
+            'size': size
+        }
+        return file_hash
 
     def _check_ffmpeg_installation(self, messages: ValidationMessages):
         try:
@@ -864,15 +998,18 @@ class ProjectValidator:
             target_width, target_height = map(int, project_model.parameters.resolution.split('x'))
             resolution_aspect_ratio = target_width / target_height
             differing_pages = []
+            zero_height_warnings = []
             for page_num in range(page_count):
                 if self._is_canceled: break
                 self.log(f"Checking PDF page {page_num + 1} of {page_count} for aspect ratio...", source='verbose_app')
                 width, height = pdf_utils.page_size(doc, page_num)
                 if height == 0:
-                    messages.add_project_warning(QCoreApplication.translate("ProjectValidator", "PDF page {0} has zero height and its aspect ratio cannot be checked.").format(page_num + 1))
+                    zero_height_warnings.append(QCoreApplication.translate("ProjectValidator", "PDF page {0} has zero height and its aspect ratio cannot be checked.").format(page_num + 1))
                     continue
                 if abs((width / height) - resolution_aspect_ratio) > config.PDF_ASPECT_RATIO_TOLERANCE:
                     differing_pages.append(page_num + 1)
+            if zero_height_warnings:
+                messages.add_project_warnings(zero_height_warnings)
             if differing_pages:
                 pages_str = ', '.join(map(str, differing_pages))
                 msg = QCoreApplication.translate("ProjectValidator",
@@ -888,7 +1025,7 @@ class ProjectValidator:
                 ).format(pages_str)
                 messages.add_project_warning(msg)
         except Exception as e:
-            messages.add_project_error(QCoreApplication.translate("ProjectValidator", "Failed to open or process PDF file: {0}. Error: {1}").format(pdf_path.name, e))
+            messages.add_project_error(QCoreApplication.translate("ProjectValidator", "Failed to open or process PDF file: {0}. Error: {1}").format(html.escape(pdf_path.name), html.escape(str(e))))
         finally:
             pdf_utils.close_pdf(doc)
         return page_count
@@ -21,7 +21,7 @@ from ssmm import config
 from ssmm import pdf_utils
 from ssmm.utils import get_ffprobe_path, get_ffmpeg_path
 from ssmm.ffmpeg_builder import FFmpegCommandBuilder
-from ssmm.slide_processor import SlideProcessorFactory
+from ssmm.slide_processor import process_slide
 from ssmm.watermark import render_watermark_overlay
 
 class ProcessingCanceled(Exception):
@@ -214,6 +214,10 @@ class VideoProcessor(QObject):
         builder = FFmpegCommandBuilder()
         if self._is_verbose:
             builder.add_global_options('-loglevel', 'info')
+        else:
+            # The periodic frame=/time= status line is re-emitted to the log on every
+            # read; progress is tracked per step, so drop it unless verbose is on.
+            builder.add_global_options('-nostats')
         return builder
 
     def run_video_creation(self, project_model: ProjectModel):
@@ -427,8 +431,7 @@ class VideoProcessor(QObject):
         
         self.log_message.emit(f"[INFO] Generating segment for slide {i+1}...", 'app')
         
-        processor = SlideProcessorFactory.get_processor(self, slide_info, slide_video_path)
-        processor.process()
+        process_slide(self, slide_info, slide_video_path)
 
         return i, slide_video_path
 
@@ -1052,17 +1055,14 @@ class VideoProcessor(QObject):
         # clamped offset rather than '-sseof -1', which seeks before the start for
         # sub-second clips and can yield no frame (aborting the render).
         prev_seek = max(0.0, self._get_media_duration(prev) - 1.0)
-        builder_prev = FFmpegCommandBuilder()
-        cmd_prev = (builder_prev.add_input(prev, ['-ss', str(prev_seek)])
-                                .set_output(prev_frame, ['-update', '1', '-vframes', '1'])
-                                .build())
-        self._run_subprocess(cmd_prev)
-
-        builder_next = FFmpegCommandBuilder()
-        cmd_next = (builder_next.add_input(next_vid)
-                                .set_output(next_frame, ['-vframes', '1', '-update', '1'])
-                                .build())
-        self._run_subprocess(cmd_next)
+        # Both boundary frames come out of a single ffmpeg run (one output per input).
+        builder_frames = FFmpegCommandBuilder()
+        cmd_frames = (builder_frames.add_input(prev, ['-ss', str(prev_seek)])
+                                    .add_input(next_vid)
+                                    .add_output(prev_frame, ['-update', '1', '-vframes', '1'], maps=['0:v:0'])
+                                    .add_output(next_frame, ['-vframes', '1', '-update', '1'], maps=['1:v:0'])
+                                    .build())
+        self._run_subprocess(cmd_frames)
         
         prev_ext = temp_dir / f'prev_extended_{index}.mp4'
         next_ext = temp_dir / f'next_extended_{index}.mp4'
@@ -1115,7 +1115,7 @@ class VideoProcessor(QObject):
             
     def _resolve_codec_option(self, codec, hw):
         if hw is not None:
-            hw_codec = config.CODEC_MAP.get(codec, {}).get(hw)
+            hw_codec = config.get_hw_encoder_name(codec, hw)
             if hw_codec:
                 return hw_codec
             # Unknown hardware/codec combination: fall back to the software encoder.
@@ -1,4 +1,5 @@
 # watermark.py
+import functools
 from pathlib import Path
 from typing import Optional
 
@@ -9,6 +10,12 @@ from ssmm.models import ProjectParameters
 from ssmm.utils import resolve_resource_path
 
 
+@functools.lru_cache(maxsize=8)
+def _load_font(font_path: str, size_px: int) -> ImageFont.FreeTypeFont:
+    # The bundled CJK font is ~16 MB; parse it once per size instead of on every preview.
+    return ImageFont.truetype(font_path, size_px)
+
+
 def render_watermark_overlay(params: ProjectParameters, width: int, height: int) -> Optional[Image.Image]:
     """Render the watermark as a transparent RGBA overlay of size ``(width, height)``.
 
@@ -28,7 +35,7 @@ def render_watermark_overlay(params: ProjectParameters, width: int, height: int)
         raise FileNotFoundError(f"Font file not found: {font_path}")
 
     font_size_px = int(height * (params.watermark_fontsize / 100))
-    font = ImageFont.truetype(str(font_path), font_size_px)
+    font = _load_font(str(font_path), font_size_px)
 
     rgb_color = config.WATERMARK_COLOR_OPTIONS_RGB.get(params.watermark_color, (255, 255, 255))
     fill_color = (*rgb_color, int(255 * (params.watermark_opacity / 100)))
@@ -1,9 +1,88 @@
 # workers.py
-from PySide6.QtCore import QObject, Signal, Slot
+import json
+from PySide6.QtCore import QIODevice, QObject, QRunnable, QSaveFile, Signal, Slot
 from pathlib import Path
 from ssmm.models import ProjectModel
 from ssmm.validator import ProjectValidator
 from ssmm.settings_manager import SettingsManager, SettingsFileParseError
+from ssmm.utils import ffmpeg_pair_available
+
+class FFmpegProbeSignals(QObject):
+    finished = Signal(bool)
+
+class FFmpegProbeTask(QRunnable):
+    # Locating ffmpeg/ffprobe stats several directories and scans PATH; run it on the
+    # global thread pool so the main window can paint first.
+    def __init__(self):
+        super().__init__()
+        self.signals = FFmpegProbeSignals()
+
+    def run(self):
+        try:
+            found = ffmpeg_pair_available()
+        except Exception:
+            found = False
+        self.signals.finished.emit(found)
+
+class DebugLogExportSignals(QObject):
+    finished = Signal(str)
+    failed = Signal(str)
+
+class DebugLogExportTask(QRunnable):
+    # The system report forks ffmpeg and stats every mounted partition, and the log itself
+    # can run to several megabytes; gather and write both off the GUI thread.
+    def __init__(self, build_report, file_path: str, log_content: str):
+        super().__init__()
+        self.build_report = build_report
+        self.file_path = file_path
+        self.log_content = log_content
+        self.signals = DebugLogExportSignals()
+
+    def run(self):
+        try:
+            report = self.build_report()
+        except Exception as e:
+            report = f"Could not collect system information: {e}"
+        # QSaveFile writes to a temporary file and renames it on commit, so a failed
+        # export never leaves a truncated log behind.
+        save_file = QSaveFile(self.file_path)
+        if not save_file.open(QIODevice.WriteOnly | QIODevice.Text):
+            self.signals.failed.emit(save_file.errorString())
+            return
+        save_file.write(f"{report}\n\n[Log Start]\n{self.log_content}".encode('utf-8'))
+        if not save_file.commit():
+            self.signals.failed.emit(save_file.errorString())
+            return
+        self.signals.finished.emit(self.file_path)
+
+class UpdateCheckSignals(QObject):
+    finished = Signal(str, str)
+    failed = Signal(str)
+
+class UpdateCheckTask(QRunnable):
+    # Fetches the latest GitHub release off the GUI thread so the window stays responsive.
+    def __init__(self, api_url: str):
+        super().__init__()
+        self.api_url = api_url
+        self.signals = UpdateCheckSignals()
+
+    def run(self):
+        # urllib.request pulls in the ssl/http stack; only load it when the user asks.
+        from urllib import request
+        try:
+            # Access GitHub API (timeout set to 5 seconds)
+            req = request.Request(self.api_url, headers={'Accept': 'application/vnd.github.v3+json'})
+            with request.urlopen(req, timeout=5) as response:
+                if response.status != 200:
+                    raise ConnectionError(f"GitHub API returned status {response.status}")
+
+                data = json.loads(response.read().decode('utf-8'))
+                latest_version_tag = data.get("tag_name", "v0.0.0").lstrip('v')
+                release_url = data.get("html_url", "")
+        except Exception as e:
+            self.signals.failed.emit(str(e))
+            return
+        self.signals.finished.emit(latest_version_tag, release_url)
 
 class EncoderTestWorker(QObject):
     finished = Signal(object, object)